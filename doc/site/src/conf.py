@@ -14,6 +14,10 @@ release = "0.2.3"
 
 # -- General configuration ---------------------------------------------------
 # https://www.sphinx-doc.org/en/master/usage/configuration.html#general-configuration
+#
+# NOTE: Keep configuration values picklable (no lambdas, modules, etc),
+# otherwise Sphinx won't reuse the cached environment (doctrees),
+# and every build becomes a full rebuild.
 
 extensions = [
     "sphinx_rtd_theme",
@@ -25,7 +29,9 @@ extensions = [
 # We don't use templates.
 # templates_path = ["_templates"]
 
-exclude_patterns = []
+# Don't walk hidden files and directories (e.g. editors or VCS meta-data)
+# when searching for source files.
+exclude_patterns = [".*", "**/.*"]
 
 
 # -- Options for HTML output -------------------------------------------------
@@ -8,11 +8,35 @@ Unit tests and examples: tests/test_dtsh_autocomp.py
 """
 
 
-from typing import cast, List, Set
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Generic,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+import bisect
+import itertools
 import os
-
-from dtsh.model import DTPath, DTNode, DTBinding, DTNodeProperty
+import weakref
+
+from dtsh.model import (
+    DTPath,
+    DTModel,
+    DTNode,
+    DTBinding,
+    DTNodeProperty,
+    DTVendor,
+)
 from dtsh.rl import DTShReadline
 from dtsh.io import DTShOutput
 from dtsh.config import DTShConfig
@@ -32,6 +56,8 @@ _dtshconf: DTShConfig = DTShConfig.getinstance()
 class RlStateDTShCommand(DTShReadline.CompleterState):
     """RL completer state for DTSh commands."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, cmd: DTShCommand) -> None:
         """Initialize completer state.
 
@@ -44,12 +70,14 @@ class RlStateDTShCommand(DTShReadline.CompleterState):
     @property
     def cmd(self) -> DTShCommand:
         """The corresponding command."""
-        return cast(DTShCommand, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTShOption(DTShReadline.CompleterState):
     """RL completer state for DTSh command options."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, opt: DTShOption) -> None:
         """Initialize completer state.
 
@@ -62,12 +90,14 @@ class RlStateDTShOption(DTShReadline.CompleterState):
     @property
     def opt(self) -> DTShOption:
         """The corresponding option."""
-        return cast(DTShOption, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTPath(DTShReadline.CompleterState):
     """RL completer state for Devicetree paths."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, node: DTNode) -> None:
         """Initialize completer state.
 
@@ -81,7 +111,7 @@ class RlStateDTPath(DTShReadline.CompleterState):
     @property
     def node(self) -> DTNode:
         """The corresponding Devicetree node."""
-        return cast(DTNode, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTProperty(DTShReadline.CompleterState):
@@ -92,6 +122,8 @@ class RlStateDTProperty(DTShReadline.CompleterState):
     - <property-name> is the node's property name
     """
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, prop: DTNodeProperty) -> None:
         """Initialize completer state.
 
@@ -105,15 +137,17 @@ class RlStateDTProperty(DTShReadline.CompleterState):
     @property
     def dtproperty(self) -> DTNodeProperty:
         """The corresponding DT property."""
-        return cast(DTNodeProperty, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateCompatStr(DTShReadline.CompleterState):
     """RL completer state for compatible strings."""
 
-    _bindings: Set[DTBinding]
+    __slots__ = ("_bindings",)
+
+    _bindings: FrozenSet[DTBinding]
 
-    def __init__(self, rlstr: str, bindings: Set[DTBinding]) -> None:
+    def __init__(self, rlstr: str, bindings: FrozenSet[DTBinding]) -> None:
         """Initialize completer state.
 
         Args:
@@ -128,7 +162,7 @@ class RlStateCompatStr(DTShReadline.CompleterState):
         return self._rlstr
 
     @property
-    def bindings(self) -> Set[DTBinding]:
+    def bindings(self) -> FrozenSet[DTBinding]:
         """All bindings for this compatible (e.g. for different buses)."""
         return self._bindings
 
@@ -136,6 +170,8 @@ class RlStateCompatStr(DTShReadline.CompleterState):
 class RlStateDTVendor(DTShReadline.CompleterState):
     """RL completer state for device or device class vendors."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, vendor: str) -> None:
         """Initialize completer state.
 
@@ -153,12 +189,14 @@ class RlStateDTVendor(DTShReadline.CompleterState):
     @property
     def vendor(self) -> str:
         """The corresponding vendor name."""
-        return cast(str, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTBus(DTShReadline.CompleterState):
     """RL completer state for Devicetree bus protocols."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str) -> None:
         """Initialize completer state.
 
@@ -176,6 +214,8 @@ class RlStateDTBus(DTShReadline.CompleterState):
 class RlStateDTAlias(DTShReadline.CompleterState):
     """RL completer state for aliased nodes."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, node: DTNode) -> None:
         """Initialize completer state.
 
@@ -193,12 +233,14 @@ class RlStateDTAlias(DTShReadline.CompleterState):
     @property
     def node(self) -> DTNode:
         """The aliased node."""
-        return cast(DTNode, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTChosen(DTShReadline.CompleterState):
     """RL completer state for chosen nodes."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, node: DTNode) -> None:
         """Initialize completer state.
 
@@ -216,12 +258,14 @@ class RlStateDTChosen(DTShReadline.CompleterState):
     @property
     def node(self) -> DTNode:
         """The chosen node."""
-        return cast(DTNode, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateDTLabel(DTShReadline.CompleterState):
     """RL completer state for labeled nodes."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, node: DTNode) -> None:
         """Initialize completer state.
 
@@ -240,12 +284,14 @@ class RlStateDTLabel(DTShReadline.CompleterState):
     @property
     def node(self) -> DTNode:
         """The labeled node."""
-        return cast(DTNode, self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateFsEntry(DTShReadline.CompleterState):
     """RL completer state for file-system paths."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, dirent: os.DirEntry[str]) -> None:
         """Initialize completer state.
 
@@ -258,12 +304,14 @@ class RlStateFsEntry(DTShReadline.CompleterState):
     @property
     def dirent(self) -> os.DirEntry[str]:
         """The corresponding file or directory."""
-        return cast(os.DirEntry[str], self._item)
+        return self._item  # type: ignore[return-value]
 
 
 class RlStateEnum(DTShReadline.CompleterState):
     """RL completer state for enumerated values."""
 
+    __slots__ = ()
+
     def __init__(self, rlstr: str, brief: str) -> None:
         """Initialize completer state.
 
@@ -281,7 +329,273 @@ class RlStateEnum(DTShReadline.CompleterState):
     @property
     def brief(self) -> str:
         """The corresponding description."""
-        return cast(str, self._item)
+        return self._item  # type: ignore[return-value]
+
+
+# Default completion views, see DTShAutocomp.display():
+# completer state type -> displayed string.
+_rlstate_views: Dict[
+    Type[DTShReadline.CompleterState], Callable[[Any], str]
+] = {
+    RlStateDTShCommand: lambda state: f"{state.cmd.name}  {state.cmd.brief}",
+    RlStateDTShOption: lambda state: f"{state.opt.usage}  {state.opt.brief}",
+    RlStateDTPath: lambda state: state.node.name,
+    RlStateCompatStr: lambda state: state.compatstr,
+    RlStateDTVendor: lambda state: f"{state.prefix}  {state.vendor}",
+    RlStateDTBus: lambda state: state.proto,
+    RlStateDTAlias: lambda state: state.alias,
+    RlStateDTChosen: lambda state: state.chosen,
+    RlStateDTLabel: lambda state: state.rlstr,
+    RlStateDTProperty: lambda state: state.dtproperty.name,
+    RlStateFsEntry: lambda state: (
+        f"{state.dirent.name}{os.path.sep}"
+        if state.dirent.is_dir()
+        else state.dirent.name
+    ),
+    RlStateEnum: lambda state: f"{state.value}  {state.brief}",
+}
+
+
+def _rlstate_default_view(state: DTShReadline.CompleterState) -> str:
+    # Fallback view for completer states without a registered view.
+    return state.rlstr
+
+
+_PrefixIndexT = TypeVar("_PrefixIndexT")
+
+
+class _PrefixIndex(Generic[_PrefixIndexT]):
+    """Index items by their names for prefix matching.
+
+    Names are sorted once: completing a prefix then bisects
+    to the first match and stops at the first mismatch,
+    which is O(log N + K) for K matches (instead of testing all N names).
+    """
+
+    # Sorted names.
+    _names: List[str]
+
+    # Items in the same order as their names.
+    _items: List[_PrefixIndexT]
+
+    def __init__(self, items: Mapping[str, _PrefixIndexT]) -> None:
+        """Initialize index.
+
+        Args:
+            items: The items to index by name.
+        """
+        self._names = sorted(items)
+        self._items = [items[name] for name in self._names]
+
+    def startswith(self, prefix: str) -> Iterator[Tuple[str, _PrefixIndexT]]:
+        """Iterate over the items whose names start with a prefix.
+
+        Args:
+            prefix: The prefix to match.
+
+        Returns:
+            A generator yielding the matched (name, item) pairs,
+            in alphabetical order of names.
+        """
+        names = self._names
+        i = bisect.bisect_left(names, prefix)
+        while i < len(names) and names[i].startswith(prefix):
+            yield (names[i], self._items[i])
+            i += 1
+
+
+# Prefix index of shell commands by name.
+_DTShCmdIndex = _PrefixIndex[DTShCommand]
+
+# Shell commands indexes, see _dtshcmd_index().
+_dtshcmd_indexes: "weakref.WeakKeyDictionary[DTSh, _DTShCmdIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _dtshcmd_index(sh: DTSh) -> _DTShCmdIndex:
+    """Get the commands of a shell indexed by name.
+
+    Args:
+        sh: The shell.
+
+    Returns:
+        The shell commands index.
+    """
+    index = _dtshcmd_indexes.get(sh)
+    if index is None:
+        # Shell commands won't change: index once.
+        index = _PrefixIndex({cmd.name: cmd for cmd in sh.commands})
+        _dtshcmd_indexes[sh] = index
+    return index
+
+
+class _DTModelIndexes:
+    """Prefix indexes for the items of a devicetree model.
+
+    Indexes are built on first use: a devicetree model won't change.
+    """
+
+    # Indexes of the last devicetree model we've completed items of.
+    _last: Optional["_DTModelIndexes"] = None
+
+    # The indexed model.
+    _dt: DTModel
+
+    # Lazy-initialized indexes.
+    _compats: Optional[_PrefixIndex[str]]
+    _vendors: Optional[_PrefixIndex[DTVendor]]
+    _buses: Optional[_PrefixIndex[str]]
+    _aliases: Optional[_PrefixIndex[DTNode]]
+    _chosen: Optional[_PrefixIndex[DTNode]]
+    _labels: Optional[_PrefixIndex[DTNode]]
+
+    # Bindings associated with compatible strings, see compat_bindings().
+    _compat_bindings: Dict[str, FrozenSet[DTBinding]]
+
+    # Indexes of children nodes, by parent path.
+    _children: Dict[str, _PrefixIndex[DTNode]]
+
+    @classmethod
+    def of(cls, dt: DTModel) -> "_DTModelIndexes":
+        """Get the indexes of a devicetree model.
+
+        The shell completes the items of a single model:
+        indexes are reset only when the model changes.
+
+        Args:
+            dt: The devicetree model.
+
+        Returns:
+            The indexes of the devicetree model.
+        """
+        indexes = cls._last
+        if (indexes is None) or not indexes.is_index_of(dt):
+            indexes = cls(dt)
+            cls._last = indexes
+        return indexes
+
+    def __init__(self, dt: DTModel) -> None:
+        """Initialize indexes.
+
+        Args:
+            dt: The devicetree model to index.
+        """
+        self._dt = dt
+        self._compats = None
+        self._vendors = None
+        self._buses = None
+        self._aliases = None
+        self._chosen = None
+        self._labels = None
+        self._compat_bindings = {}
+        self._children = {}
+
+    def is_index_of(self, dt: DTModel) -> bool:
+        """Whether these are the indexes of a devicetree model.
+
+        Args:
+            dt: The devicetree model.
+
+        Returns:
+            True if this object indexes this very model.
+        """
+        return self._dt is dt
+
+    @property
+    def compats(self) -> _PrefixIndex[str]:
+        """Compatible strings."""
+        if self._compats is None:
+            self._compats = _PrefixIndex(
+                {compat: compat for compat in self._dt.compatible_strings}
+            )
+        return self._compats
+
+    @property
+    def vendors(self) -> _PrefixIndex[DTVendor]:
+        """Vendors by prefix."""
+        if self._vendors is None:
+            self._vendors = _PrefixIndex(
+                {vendor.prefix: vendor for vendor in self._dt.vendors}
+            )
+        return self._vendors
+
+    @property
+    def buses(self) -> _PrefixIndex[str]:
+        """Bus protocols."""
+        if self._buses is None:
+            self._buses = _PrefixIndex(
+                {proto: proto for proto in self._dt.bus_protocols}
+            )
+        return self._buses
+
+    @property
+    def aliases(self) -> _PrefixIndex[DTNode]:
+        """Aliased nodes by alias name."""
+        if self._aliases is None:
+            self._aliases = _PrefixIndex(self._dt.aliased_nodes)
+        return self._aliases
+
+    @property
+    def chosen(self) -> _PrefixIndex[DTNode]:
+        """Chosen nodes by parameter name."""
+        if self._chosen is None:
+            self._chosen = _PrefixIndex(self._dt.chosen_nodes)
+        return self._chosen
+
+    @property
+    def labels(self) -> _PrefixIndex[DTNode]:
+        """Labeled nodes by label."""
+        if self._labels is None:
+            self._labels = _PrefixIndex(self._dt.labeled_nodes)
+        return self._labels
+
+    def compat_bindings(self, compat: str) -> FrozenSet[DTBinding]:
+        """Get the bindings associated with a compatible string.
+
+        Args:
+            compat: A compatible string that appears in the indexed model.
+
+        Returns:
+            The bindings for this compatible (e.g. for different buses).
+        """
+        compat_bindings = self._compat_bindings.get(compat)
+        if compat_bindings is None:
+            bindings: Set[DTBinding] = set()
+            # 1st, try the natural API, with unknown bus.
+            binding = self._dt.get_compatible_binding(compat)
+            if binding:
+                # Exact single match (binding that does not expect
+                # a bus of appearance).
+                bindings.add(binding)
+            else:
+                # The compatible string is associated with a bus of appearance:
+                # - look for nodes specified by a binding whose compatible string
+                #   matches our search
+                # - for each node, add its binding to those associated with
+                #   the compatible string candidate
+                for node in self._dt.get_compatible_devices(compat):
+                    if node.binding:
+                        bindings.add(node.binding)
+            # Completer states will share this set: freeze it.
+            compat_bindings = frozenset(bindings)
+            self._compat_bindings[compat] = compat_bindings
+        return compat_bindings
+
+    def children(self, node: DTNode) -> _PrefixIndex[DTNode]:
+        """Get the children of a node by name.
+
+        Args:
+            node: A node of the indexed model.
+
+        Returns:
+            The node children, indexed by name.
+        """
+        index = self._children.get(node.path)
+        if index is None:
+            index = _PrefixIndex({child.name: child for child in node.children})
+            self._children[node.path] = index
+        return index
 
 
 class DTShAutocomp:
@@ -290,6 +604,9 @@ class DTShAutocomp:
     # The shell this will auto-complete the command line of.
     _dtsh: DTSh
 
+    # Last successfully parsed command line: (rlbuf, command, redirection).
+    _parsed_rlbuf: Optional[Tuple[str, DTShCommand, Optional[str]]]
+
     @staticmethod
     def complete_dtshcmd(
         cs_txt: str, sh: DTSh
@@ -303,11 +620,10 @@ class DTShAutocomp:
         Returns:
             The commands that are valid completer states.
         """
-        return sorted(
-            RlStateDTShCommand(cmd.name, cmd)
-            for cmd in sh.commands
-            if cmd.name.startswith(cs_txt)
-        )
+        return [
+            RlStateDTShCommand(name, cmd)
+            for name, cmd in _dtshcmd_index(sh).startswith(cs_txt)
+        ]
 
     @staticmethod
     def complete_dtshopt(
@@ -322,69 +638,49 @@ class DTShAutocomp:
         Returns:
             The options that are valid completer states.
         """
-        states: List[DTShReadline.CompleterState] = []
+        states: List[DTShReadline.CompleterState]
 
         if cs_txt.startswith("--"):
             # Only options with a long name.
-            prefix = cs_txt[2:]
-            states.extend(
-                sorted(
-                    [
-                        RlStateDTShOption(f"--{opt.longname}", opt)
-                        for opt in cmd.options
-                        if opt.longname and opt.longname.startswith(prefix)
-                    ],
-                    key=lambda x: "-"
-                    if x.rlstr == "--help"
-                    else x.rlstr.lower(),
-                )
+            states = [
+                RlStateDTShOption(opt.longform, opt)
+                for opt in cmd.options
+                if opt.longform and opt.longform.startswith(cs_txt)
+            ]
+            states.sort(
+                key=lambda x: "-" if x.rlstr == "--help" else x.rlstr.lower()
+            )
+        elif cs_txt == "-":
+            # All options, those with a short name first,
+            # then options with only a long name:
+            # partition options in a single pass.
+            states = []
+            longopts: List[DTShReadline.CompleterState] = []
+            for opt in cmd.options:
+                if opt.shortform:
+                    states.append(RlStateDTShOption(opt.shortform, opt))
+                elif opt.longform:
+                    longopts.append(RlStateDTShOption(opt.longform, opt))
+            states.sort(
+                key=lambda x: "-" if x.rlstr == "-h" else x.rlstr.lower()
             )
+            longopts.sort(key=lambda x: x.rlstr.lower())
+            states.extend(longopts)
         elif cs_txt.startswith("-"):
-            if cs_txt == "-":
-                # All options, those with a short name first.
-                states.extend(
-                    sorted(
-                        [
-                            RlStateDTShOption(f"-{opt.shortname}", opt)
-                            for opt in cmd.options
-                            if opt.shortname
-                        ],
-                        key=lambda x: "-"
-                        if x.rlstr == "-h"
-                        else x.rlstr.lower(),
-                    )
-                )
-                # Then options with only a long name.
-                states.extend(
-                    sorted(
-                        [
-                            RlStateDTShOption(f"--{opt.longname}", opt)
-                            for opt in cmd.options
-                            if not opt.shortname
-                        ],
-                        key=lambda x: x.rlstr.lower(),
-                    )
-                )
-            else:
-                # User input is like "-ld", "ld" options are then already set.
-                already_set = cs_txt[1:]
-                # Propose all options with a short name that are not already set
-                # within the completion scope.
-                states.extend(
-                    sorted(
-                        [
-                            RlStateDTShOption(
-                                f"-{already_set}{opt.shortname}", opt
-                            )
-                            for opt in cmd.options
-                            if opt.shortname
-                            and opt.shortname not in already_set
-                        ],
-                        key=lambda x: "-"
-                        if x.rlstr == "-h"
-                        else x.rlstr.lower(),
-                    )
-                )
+            # User input is like "-ld", "ld" options are then already set.
+            already_set = cs_txt[1:]
+            # Propose all options with a short name that are not already set
+            # within the completion scope.
+            states = [
+                RlStateDTShOption(f"-{already_set}{opt.shortname}", opt)
+                for opt in cmd.options
+                if opt.shortname and opt.shortname not in already_set
+            ]
+            states.sort(
+                key=lambda x: "-" if x.rlstr == "-h" else x.rlstr.lower()
+            )
+        else:
+            states = []
 
         return states
 
@@ -399,41 +695,44 @@ class DTShAutocomp:
             sh: The context shell.
 
         Returns:
-            The Devicetree paths that are valid completer states.
+            The Devicetree paths that are valid completer states,
+            in alphabetical order.
         """
 
-        if cs_txt.startswith("&"):
-            parts = DTPath.split(cs_txt)
-            if len(parts) == 1:
-                # Auto-complete with labels only for the first path component.
-                return DTShAutocomp.complete_dtlabel(cs_txt, sh)
-
-        dirname = DTPath.dirname(cs_txt)
-        if (dirname == ".") and not cs_txt.startswith("./"):
-            # We'll search the current working branch
-            # because we complete a relative DT path.
-            # Though, we don't want to include the "." path component
-            # into the substitution strings if it's not actually part
-            # of the completion scope.
-            dirname = ""
+        if cs_txt.startswith("&") and ("/" not in cs_txt[:-1]):
+            # Auto-complete with labels only for the first path component
+            # (possibly followed by a trailing "/").
+            return DTShAutocomp.complete_dtlabel(cs_txt, sh)
+
+        # Split the path once into <dirname>/<basename>,
+        # with DTPath.dirname() and DTPath.basename() semantic.
+        i_base = cs_txt.rfind("/") + 1
+        basename = cs_txt[i_base:]
+        dirname = cs_txt[:i_base]
+        if dirname.strip("/"):
+            # Strip trailing "/", unless dirname is the root.
+            dirname = dirname.rstrip("/")
+        # When dirname is empty, we'll search the current working branch
+        # because we complete a relative DT path.
+        # Though, unlike DTPath.dirname(), we don't want to include
+        # the "." path component into the substitution strings
+        # if it's not actually part of the completion scope.
 
-        states: List[DTShReadline.CompleterState] = []
         try:
             dirnode = sh.node_at(dirname)
         except DTPathNotFoundError:
             # Won't complete invalid path.
-            pass
-        else:
-            prefix = DTPath.basename(cs_txt)
-            states.extend(
-                # Intelligently join <dirname> and <nodename>
-                # to get a valid substitution string.
-                RlStateDTPath(DTPath.join(dirname, child.name), child)
-                for child in dirnode.children
-                if child.name.startswith(prefix)
-            )
+            return []
 
-        return sorted(states)
+        children = _DTModelIndexes.of(sh.dt).children(dirnode)
+        # Substitution strings share the same <dirname>:
+        # children matched in name order are already sorted.
+        return [
+            # Intelligently join <dirname> and <nodename>
+            # to get a valid substitution string.
+            RlStateDTPath(DTPath.join(dirname, name), child)
+            for name, child in children.startswith(basename)
+        ]
 
     @staticmethod
     def complete_dtpathx(
@@ -454,24 +753,24 @@ class DTShAutocomp:
         Returns:
             Sorted completion states for matched nodes or properties.
         """
-        i_prop = cs_txt.rfind("$")
-        if i_prop == -1:
+        # Split "<path>$<prefix>" in a single pass.
+        dtpath, sep, prefix = cs_txt.rpartition("$")
+        if not sep:
             return DTShAutocomp.complete_dtpath(cs_txt, sh)
 
-        dtpath = cs_txt[:i_prop]
         try:
             node = sh.node_at(dtpath)
         except DTPathNotFoundError:
             return []
 
-        prefix = cs_txt[i_prop + 1 :]
         states: List[DTShReadline.CompleterState] = [
             RlStateDTProperty(f"{dtpath}${prop.name}", prop)
             for prop in node.all_dtproperties()
             if prop.name.startswith(prefix)
         ]
 
-        return sorted(states)
+        states.sort()
+        return states
 
     @staticmethod
     def complete_dtcompat(
@@ -487,34 +786,11 @@ class DTShAutocomp:
             The compatible string values that are valid completer states,
             associated with the relevant bindings.
         """
-        states: List[DTShReadline.CompleterState] = []
-        for compatible in sorted(
-            (
-                compat
-                for compat in sh.dt.compatible_strings
-                if compat.startswith(cs_txt)
-            )
-        ):
-            bindings: Set[DTBinding] = set()
-            # 1st, try the natural API, with unknown bus.
-            binding = sh.dt.get_compatible_binding(compatible)
-            if binding:
-                # Exact single match (binding that does not expect
-                # a bus of appearance).
-                bindings.add(binding)
-            else:
-                # The compatible string is associated with a bus of appearance:
-                # - look for nodes specified by a binding whose compatible string
-                #   matches our search
-                # - for each node, add its binding to those associated with
-                #   the compatible string candidate
-                for node in sh.dt.get_compatible_devices(compatible):
-                    if node.binding:
-                        bindings.add(node.binding)
-
-            states.append(RlStateCompatStr(compatible, bindings))
-
-        return states
+        indexes = _DTModelIndexes.of(sh.dt)
+        return [
+            RlStateCompatStr(compat, indexes.compat_bindings(compat))
+            for compat, _ in indexes.compats.startswith(cs_txt)
+        ]
 
     @staticmethod
     def complete_dtvendor(
@@ -529,11 +805,11 @@ class DTShAutocomp:
         Returns:
             The vendors that are valid completer states.
         """
-        return sorted(
-            RlStateDTVendor(vendor.prefix, vendor.name)
-            for vendor in sh.dt.vendors
-            if vendor.prefix.startswith(cs_txt)
-        )
+        vendors = _DTModelIndexes.of(sh.dt).vendors
+        return [
+            RlStateDTVendor(prefix, vendor.name)
+            for prefix, vendor in vendors.startswith(cs_txt)
+        ]
 
     @staticmethod
     def complete_dtbus(
@@ -548,11 +824,8 @@ class DTShAutocomp:
         Returns:
             The bus protocols that are valid completer states.
         """
-        return sorted(
-            RlStateDTBus(proto)
-            for proto in sh.dt.bus_protocols
-            if proto.startswith(cs_txt)
-        )
+        buses = _DTModelIndexes.of(sh.dt).buses
+        return [RlStateDTBus(proto) for proto, _ in buses.startswith(cs_txt)]
 
     @staticmethod
     def complete_dtalias(
@@ -567,11 +840,11 @@ class DTShAutocomp:
         Returns:
             The aliased nodes that are valid completer states.
         """
-        return sorted(
+        aliases = _DTModelIndexes.of(sh.dt).aliases
+        return [
             RlStateDTAlias(alias, node)
-            for alias, node in sh.dt.aliased_nodes.items()
-            if alias.startswith(cs_txt)
-        )
+            for alias, node in aliases.startswith(cs_txt)
+        ]
 
     @classmethod
     def complete_dtchosen(
@@ -586,11 +859,11 @@ class DTShAutocomp:
         Returns:
             The chosen nodes that are valid completer states.
         """
-        return sorted(
+        chosen_nodes = _DTModelIndexes.of(sh.dt).chosen
+        return [
             RlStateDTChosen(chosen, node)
-            for chosen, node in sh.dt.chosen_nodes.items()
-            if chosen.startswith(cs_txt)
-        )
+            for chosen, node in chosen_nodes.startswith(cs_txt)
+        ]
 
     @classmethod
     def complete_dtlabel(
@@ -621,20 +894,23 @@ class DTShAutocomp:
                 return []
 
         # Complete with matching labels.
-        pattern = cs_txt[i_label:]
-        states: List[RlStateDTLabel] = [
+        matches = _DTModelIndexes.of(sh.dt).labels.startswith(cs_txt[i_label:])
+        first = next(matches, None)
+        if first is None:
+            return []
+        second = next(matches, None)
+        if second is None:
+            # Exact match: convert completion state to path.
+            _, node = first
+            return [RlStateDTPath(node.path, node)]
+
+        return [
             # "&" is retained within the completion state
             # when it's present in the completion scope.
             RlStateDTLabel(f"&{label}" if (i_label > 0) else label, node)
-            for label, node in sh.dt.labeled_nodes.items()
-            if label.startswith(pattern)
+            for label, node in itertools.chain((first, second), matches)
         ]
 
-        if len(states) == 1:
-            # Exact match: convert completion state to path.
-            return [RlStateDTPath(states[0].node.path, states[0].node)]
-        return sorted(states)
-
     @staticmethod
     def complete_fspath(cs_txt: str) -> List[DTShReadline.CompleterState]:
         """Complete file-system path.
@@ -656,37 +932,48 @@ class DTShAutocomp:
         else:
             dirpath = os.getcwd()
 
-        if not os.path.isdir(dirpath):
+        basename = os.path.basename(cs_txt)
+        # Hide commonly hidden files and directories on POSIX-like systems.
+        hide_dotted = _dtshconf.pref_fs_hide_dotted
+        # Filter and classify matched entries in a single pass
+        # over the directory.
+        fs_dirs: List[os.DirEntry[str]] = []
+        fs_files: List[os.DirEntry[str]] = []
+        try:
+            with os.scandir(dirpath) as it:
+                for entry in it:
+                    if not entry.name.startswith(basename):
+                        continue
+                    if hide_dotted and entry.name.startswith("."):
+                        continue
+                    if entry.is_dir():
+                        fs_dirs.append(entry)
+                    elif entry.is_file():
+                        fs_files.append(entry)
+        except OSError:
+            # Not a directory, or not a readable one: rather than
+            # asking first, let scandir() fail without extra stat().
             return []
 
-        basename = os.path.basename(cs_txt)
-        fs_entries = [
-            entry
-            for entry in os.scandir(dirpath)
-            if entry.name.startswith(basename)
-        ]
-        if _dtshconf.pref_fs_hide_dotted:
-            # Hide commonly hidden files and directories on POSIX-like systems.
-            fs_entries = [
-                entry for entry in fs_entries if not entry.name.startswith(".")
-            ]
+        fs_dirs.sort(key=lambda entry: entry.name)
+        fs_files.sort(key=lambda entry: entry.name)
 
-        fs_entries.sort(key=lambda entry: entry.name)
+        # Join <dirname> and entry names like os.path.join() would,
+        # but once.
+        if dirname and not dirname.endswith(os.path.sep):
+            prefix = f"{dirname}{os.path.sep}"
+        else:
+            prefix = dirname
 
         # Directories 1st.
         states: List[DTShReadline.CompleterState] = [
             # Append "/" to completion matches for directories.
-            RlStateFsEntry(
-                f"{os.path.join(dirname, entry.name)}{os.path.sep}", entry
-            )
-            for entry in fs_entries
-            if entry.is_dir()
+            RlStateFsEntry(f"{prefix}{entry.name}{os.path.sep}", entry)
+            for entry in fs_dirs
         ]
         # Then files.
         states.extend(
-            RlStateFsEntry(os.path.join(dirname, entry.name), entry)
-            for entry in fs_entries
-            if entry.is_file()
+            RlStateFsEntry(f"{prefix}{entry.name}", entry) for entry in fs_files
         )
 
         return states
@@ -698,6 +985,9 @@ class DTShAutocomp:
             sh: The context shell.
         """
         self._dtsh = sh
+        self._parsed_rlbuf = None
+        # Index the shell commands now rather than on the first completion.
+        _dtshcmd_index(sh)
 
     def complete(
         self, cs_txt: str, rlbuf: str, cs_begin: int, cs_end: int
@@ -744,11 +1034,16 @@ class DTShAutocomp:
         if not ante_cs_txt:
             return DTShAutocomp.complete_dtshcmd(cs_txt, self._dtsh)
 
-        try:
-            cmd, _, redir2 = self._dtsh.parse_cmdline(rlbuf)
-        except DTShCommandNotFoundError:
-            # Won't auto-complete a command line deemed to fail.
-            return []
+        if self._parsed_rlbuf and (self._parsed_rlbuf[0] == rlbuf):
+            # Asking again for the same command line (e.g. TAB-TAB).
+            _, cmd, redir2 = self._parsed_rlbuf
+        else:
+            try:
+                cmd, _, redir2 = self._dtsh.parse_cmdline(rlbuf)
+            except DTShCommandNotFoundError:
+                # Won't auto-complete a command line deemed to fail.
+                return []
+            self._parsed_rlbuf = (rlbuf, cmd, redir2)
 
         if redir2:
             # Auto-completion is asking for possible redirection file paths
@@ -769,11 +1064,11 @@ class DTShAutocomp:
         # Auto-completion is asking for possible argument values
         # when the completion scope immediately follows a command's
         # argument name.
-        ante_opts = ante_cs_txt.split()
-        if ante_opts:
-            last_opt = cmd.option(ante_opts[-1])
-            if isinstance(last_opt, DTShArg):
-                return last_opt.autocomp(cs_txt, self._dtsh)
+        # Only the last word before the completion scope matters here,
+        # don't split the whole (non empty) command line.
+        last_opt = cmd.option(ante_cs_txt.rsplit(maxsplit=1)[-1])
+        if isinstance(last_opt, DTShArg):
+            return last_opt.autocomp(cs_txt, self._dtsh)
 
         # Eventually, try to auto-complete with parameter values.
         if cmd.param:
@@ -799,48 +1094,13 @@ class DTShAutocomp:
             out: Where to display these completions.
             completions: The completions to display.
         """
-        for state in states:
-            if isinstance(state, RlStateDTShCommand):
-                cmd = state.cmd
-                out.write(f"{cmd.name}  {cmd.brief}")
-
-            elif isinstance(state, RlStateDTShOption):
-                opt = state.opt
-                out.write(f"{opt.usage}  {opt.brief}")
-
-            elif isinstance(state, RlStateDTPath):
-                node = state.node
-                out.write(node.name)
+        if not states:
+            return
 
-            elif isinstance(state, RlStateCompatStr):
-                compat = state.compatstr
-                out.write(compat)
-
-            elif isinstance(state, RlStateDTVendor):
-                out.write(f"{state.prefix}  {state.vendor}")
-
-            elif isinstance(state, RlStateDTBus):
-                proto = state.proto
-                out.write(proto)
-
-            elif isinstance(state, RlStateDTAlias):
-                out.write(state.alias)
-
-            elif isinstance(state, RlStateDTChosen):
-                out.write(state.chosen)
-
-            elif isinstance(state, RlStateDTProperty):
-                out.write(state.dtproperty.name)
-
-            elif isinstance(state, RlStateFsEntry):
-                dirent = state.dirent
-                if dirent.is_dir():
-                    out.write(f"{dirent.name}{os.path.sep}")
-                else:
-                    out.write(dirent.name)
-
-            elif isinstance(state, RlStateEnum):
-                out.write(f"{state.value}  {state.brief}")
-
-            else:
-                out.write(state.rlstr)
+        # Completer states have no subclasses: look up views by type.
+        lines: List[str] = [
+            _rlstate_views.get(type(state), _rlstate_default_view)(state)
+            for state in states
+        ]
+        # Write all completions at once, one per line.
+        out.write("\n".join(lines))
@@ -38,27 +38,27 @@ class DTShBuiltinAlias(DTShCommandLongFmt):
         """Overrides DTShCommand.execute()."""
         super().execute(argv, sh, out)
 
+        aliased_nodes = sh.dt.aliased_nodes
+        if not aliased_nodes:
+            # Nothing to filter or output.
+            return
+
         param_alias = self.with_param(DTShParamAlias).alias
+        enabled_only = self.with_flag(DTShFlagEnabledOnly)
 
         alias2node: Mapping[str, DTNode]
-        if param_alias:
-            # Aliased nodes that match the alias parameter.
+        if param_alias or enabled_only:
+            # Aliased nodes that match the alias parameter,
+            # filtering out disabled nodes if asked to: single pass.
             alias2node = {
                 alias: node
-                for alias, node in sh.dt.aliased_nodes.items()
-                if alias.find(param_alias) != -1
+                for alias, node in aliased_nodes.items()
+                if ((not param_alias) or (param_alias in alias))
+                and ((not enabled_only) or node.enabled)
             }
         else:
             # All aliased nodes.
-            alias2node = sh.dt.aliased_nodes
-
-        if self.with_flag(DTShFlagEnabledOnly):
-            # Filter out aliased nodes which are disabled.
-            alias2node = {
-                alias: node
-                for alias, node in alias2node.items()
-                if node.enabled
-            }
+            alias2node = aliased_nodes
 
         # Silently output nothing if no matched aliased nodes.
         if alias2node:
@@ -68,6 +68,10 @@ class DTShBuiltinAlias(DTShCommandLongFmt):
                 view = ViewNodeAkaList(alias2node, self.get_longfmt("pC"))
                 out.write(view)
             else:
-                # POSIX-like symlinks (link -> file).
-                for alias, node in alias2node.items():
-                    out.write(f"{alias} -> {node.path}")
+                # POSIX-like symlinks (link -> file), written at once.
+                out.write(
+                    "\n".join(
+                        f"{alias} -> {node.path}"
+                        for alias, node in alias2node.items()
+                    )
+                )
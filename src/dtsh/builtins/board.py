@@ -10,6 +10,7 @@ Print board information.
 
 from typing import Sequence
 
+from rich.text import Text
 
 from dtsh.dts import YAMLFile, DTS, DTSFile
 from dtsh.io import DTShOutput
@@ -43,6 +44,15 @@ class DTShBuiltinBoard(DTShCommand):
     Print the board file (DTS) if "--board-file" is set.
     """
 
+    # Constant deprecation warning, assembled once.
+    _WARN_DEPRECATED: Text = TextUtil.assemble(
+        TextUtil.mk_warning("The "),
+        TextUtil.bold(TextUtil.mk_warning("board")),
+        TextUtil.mk_warning(" builtin is deprecated: please use the "),
+        TextUtil.bold(TextUtil.mk_warning("uname")),
+        TextUtil.mk_warning(" command instead."),
+    )
+
     def __init__(self) -> None:
         super().__init__(
             "board",
@@ -59,7 +69,8 @@ class DTShBuiltinBoard(DTShCommand):
         """Overrides DTShCommand.execute()."""
         super().execute(argv, sh, out)
 
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
         # Show deprecation warning even in pager.
@@ -76,7 +87,7 @@ class DTShBuiltinBoard(DTShCommand):
             else:
                 self._out_board_yaml_raw(sh.dt.dts, out)
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def _out_board_dts_rich(self, dts: DTS, out: DTShOutput) -> None:
@@ -109,24 +120,16 @@ class DTShBuiltinBoard(DTShCommand):
 
     def _out_board_dts_raw(self, dts: DTS, out: DTShOutput) -> None:
         if dts.board_file:
-            out.write(DTSFile(dts.board_file).content)
+            out.write(DTSFile.cached(dts.board_file).content)
         else:
             out.write("Board file unavailable (DTS).")
 
     def _out_board_yaml_raw(self, dts: DTS, out: DTShOutput) -> None:
         if dts.board_yaml:
-            out.write(YAMLFile(dts.board_yaml).content)
+            out.write(YAMLFile.cached(dts.board_yaml).content)
         else:
             out.write("Board file unavailable (YAML).")
 
     def _warn_deprecated(self, out: DTShOutput) -> None:
-        out.write(
-            TextUtil.assemble(
-                TextUtil.mk_warning("The "),
-                TextUtil.bold(TextUtil.mk_warning("board")),
-                TextUtil.mk_warning(" builtin is deprecated: please use the "),
-                TextUtil.bold(TextUtil.mk_warning("uname")),
-                TextUtil.mk_warning(" command instead."),
-            )
-        )
+        out.write(self._WARN_DEPRECATED)
         out.write()
@@ -112,9 +112,12 @@ class DTShBuiltinCat(DTShCommand):
         # Command will fail here if the xpath parameter is invalid
         # (node or property not found).
         parm_dtnode, parm_dtprops = parm_xpath.xsplit(self, sh)
+        # Or if the options are invalid for this parameter.
+        self._check_options(parm_xpath.is_globexpr())
 
         # Setup pager after we could fail.
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
         if parm_dtprops is not None:
@@ -137,12 +140,14 @@ class DTShBuiltinCat(DTShCommand):
             # Concatenate and output info about node.
             self.cat_dtnode(parm_dtnode, out)
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def cat_dtnode(self, dtnode: DTNode, out: DTShOutput) -> None:
         """The command is invoked with a DT node as parameter.
 
+        The command options MUST have been validated (see execute()).
+
         Args:
             dtnode: The node to cat information about.
             out: Where to cat.
@@ -155,6 +160,8 @@ class DTShBuiltinCat(DTShCommand):
     def cat_dtproperty(self, dtprop: DTNodeProperty, out: DTShOutput) -> None:
         """The command is invoked with a single DT property as parameter.
 
+        The command options MUST have been validated (see execute()).
+
         Args:
             dtprop: The property parameter.
             out: Where to cat.
@@ -171,18 +178,13 @@ class DTShBuiltinCat(DTShCommand):
 
         It will output property values.
 
+        The command options MUST have been validated (see execute()).
+
         Args:
             dtprops: The possibly empty list of properties
               matching the PROP globbing expression.
             out: Where to cat.
         """
-        # Precondition for both POSIX-like and rich outputs.
-        if self.with_flag(DTShFlagAll) or self._nfmtspecs():
-            raise DTShCommandError(
-                self,
-                "globbing properties, options '-DBYA' not allowed",
-            )
-
         # Ignore no match.
         if dtprops:
             if self._with_longfmt():
@@ -254,18 +256,12 @@ class DTShBuiltinCat(DTShCommand):
         self._out_rich_sections(sections, out)
 
     def _out_dtnode_raw(self, node: DTNode, out: DTShOutput) -> None:
-        # Precondition for POSIX-like output only.
-        if self._nfmtspecs() > 1:
-            raise DTShCommandError(
-                self, "more than one option among '-DBY' requires '-l'"
-            )
-
         if self.with_flag(DTShFlagDescription):
             if node.description:
                 out.write(node.description)
         elif self.with_flag(DTShFlagYamlFile):
             if node.binding_path:
-                yaml = YAMLFile(node.binding_path)
+                yaml = YAMLFile.cached(node.binding_path)
                 out.write(yaml.content)
         elif self.with_flag(DTShFlagBindings):
             if node.binding_path:
@@ -338,25 +334,25 @@ class DTShBuiltinCat(DTShCommand):
     def _out_dtproperties_raw(
         self, dtprops: List[DTNodeProperty], out: DTShOutput
     ) -> None:
-        for dtprop in dtprops:
-            strval = DTSUtil.mk_property_value(dtprop)
-            out.write(f"{dtprop.name}: {strval}")
+        if not dtprops:
+            return
+        # One line per property, written at once.
+        out.write(
+            "\n".join(
+                f"{dtprop.name}: {DTSUtil.mk_property_value(dtprop)}"
+                for dtprop in dtprops
+            )
+        )
 
     def _out_dtproperty_raw(
         self, dtprop: DTNodeProperty, out: DTShOutput
     ) -> None:
-        # Precondition for POSIX-like output only.
-        if self._nfmtspecs() > 1:
-            raise DTShCommandError(
-                self, "more than one option among '-DBY' requires '-l'"
-            )
-
         if self.with_flag(DTShFlagDescription):
             if dtprop.description:
                 out.write(dtprop.description)
         elif self.with_flag(DTShFlagYamlFile):
             if dtprop.path:
-                yaml = YAMLFile(dtprop.path)
+                yaml = YAMLFile.cached(dtprop.path)
                 out.write(yaml.content)
         elif self.with_flag(DTShFlagBindings):
             if dtprop.path:
@@ -365,6 +361,22 @@ class DTShBuiltinCat(DTShCommand):
             # Default to property value.
             out.write(DTSUtil.mk_property_value(dtprop))
 
+    def _check_options(self, globexpr: bool) -> None:
+        # Validate options once, before we output anything.
+        nfmtspecs = self._nfmtspecs()
+        if globexpr:
+            # Precondition for both POSIX-like and rich outputs.
+            if nfmtspecs or self.with_flag(DTShFlagAll):
+                raise DTShCommandError(
+                    self,
+                    "globbing properties, options '-DBYA' not allowed",
+                )
+        elif nfmtspecs > 1 and not self._with_longfmt():
+            # Precondition for POSIX-like output only.
+            raise DTShCommandError(
+                self, "more than one option among '-DBY' requires '-l'"
+            )
+
     def _with_longfmt(self) -> bool:
         # Should we use formatted output ?
         return (
@@ -397,6 +409,4 @@ class DTShBuiltinCat(DTShCommand):
             out.write(sections[0].content)
         else:
             # Otherwise, use headings writer.
-            hds_writer = HeadingsContentWriter()
-            for section in sections:
-                hds_writer.write_section(section, out)
+            HeadingsContentWriter().write_sections(sections, out)
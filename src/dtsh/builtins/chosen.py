@@ -38,27 +38,27 @@ class DTShBuiltinChosen(DTShCommandLongFmt):
         """Overrides DTShCommand.execute()."""
         super().execute(argv, sh, out)
 
+        chosen_nodes = sh.dt.chosen_nodes
+        if not chosen_nodes:
+            # Nothing to filter or output.
+            return
+
         param_chosen = self.with_param(DTShParamChosen).chosen
+        enabled_only = self.with_flag(DTShFlagEnabledOnly)
 
         chosen2node: Mapping[str, DTNode]
-        if param_chosen:
-            # Chosen nodes that match the chosen parameter.
+        if param_chosen or enabled_only:
+            # Chosen nodes that match the chosen parameter,
+            # filtering out disabled nodes if asked to: single pass.
             chosen2node = {
                 chosen: node
-                for chosen, node in sh.dt.chosen_nodes.items()
-                if chosen.find(param_chosen) != -1
+                for chosen, node in chosen_nodes.items()
+                if ((not param_chosen) or (param_chosen in chosen))
+                and ((not enabled_only) or node.enabled)
             }
         else:
             # All chosen nodes.
-            chosen2node = sh.dt.chosen_nodes
-
-        if self.with_flag(DTShFlagEnabledOnly):
-            # Filter out chosen nodes which are disabled.
-            chosen2node = {
-                chosen: node
-                for chosen, node in chosen2node.items()
-                if node.enabled
-            }
+            chosen2node = chosen_nodes
 
         # Silently output nothing if no matched chosen nodes.
         if chosen2node:
@@ -68,6 +68,10 @@ class DTShBuiltinChosen(DTShCommandLongFmt):
                 view = ViewNodeAkaList(chosen2node, self.get_longfmt("NC"))
                 out.write(view)
             else:
-                # POSIX-like symlinks (link -> file).
-                for choice, node in chosen2node.items():
-                    out.write(f"{choice} -> {node.path}")
+                # POSIX-like symlinks (link -> file), written at once.
+                out.write(
+                    "\n".join(
+                        f"{choice} -> {node.path}"
+                        for choice, node in chosen2node.items()
+                    )
+                )
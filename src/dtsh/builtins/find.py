@@ -74,7 +74,8 @@ class DTShBuiltinFind(DTShCommandLongFmt):
             DTShParamDTPaths
         ).expand(self, sh)
 
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
         # What to do here depends on the appropriate model kind:
@@ -85,7 +86,7 @@ class DTShBuiltinFind(DTShCommandLongFmt):
         else:
             self._find_nodes(path_expansions, sh, out)
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def _find_nodes(
@@ -134,9 +135,9 @@ class DTShBuiltinFind(DTShCommandLongFmt):
     def _output_nodes_raw(
         self, path2node: Mapping[str, DTNode], count: int, out: DTShOutput
     ) -> None:
-        # Output paths of found nodes.
-        for path in path2node:
-            out.write(path)
+        # Output paths of found nodes, written at once.
+        if path2node:
+            out.write("\n".join(path2node))
         if self.with_flag(DTShFlagCount):
             out.write()
             self._output_count_raw(count, out)
@@ -209,14 +210,15 @@ class DTShBuiltinFind(DTShCommandLongFmt):
         sketch = self.get_sketch(SketchMV.Layout.TWO_SIDED)
         cols = self.get_longfmt(sketch.default_fmt)
 
+        # Layout options, resolved once for all views.
+        order_by = self.arg_sorter
+        reverse = self.flag_reverse
+        enabled_only = self.flag_enabled_only
+
         N = len(path2walkable)
-        for i, (_, comb) in enumerate(path2walkable.items()):
+        for i, comb in enumerate(path2walkable.values()):
             view = ViewNodeTwoSided(comb, cols)
-            view.do_layout(
-                self.arg_sorter,
-                self.flag_reverse,
-                self.flag_enabled_only,
-            )
+            view.do_layout(order_by, reverse, enabled_only)
             out.write(view)
 
             if i != N - 1:
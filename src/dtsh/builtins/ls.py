@@ -10,7 +10,7 @@ Unit tests and examples: tests/test_dtsh_builtin_ls.py
 """
 
 
-from typing import Sequence, Dict, Mapping
+from typing import List, Sequence, Dict, Mapping
 
 from dtsh.model import DTNode
 from dtsh.io import DTShOutput
@@ -59,7 +59,8 @@ class DTShBuiltinLs(DTShCommandLongFmt):
             DTShParamDTPaths
         ).expand(self, sh)
 
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
         # What to do here depends on the appropriate model kind,
@@ -71,7 +72,7 @@ class DTShBuiltinLs(DTShCommandLongFmt):
             # List branches as directories.
             self._ls_contents(path_expansions, sh, out)
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def _ls_nodes(
@@ -109,8 +110,9 @@ class DTShBuiltinLs(DTShCommandLongFmt):
     def _output_nodes_raw(
         self, path2node: Mapping[str, DTNode], out: DTShOutput
     ) -> None:
-        for path in path2node:
-            out.write(path)
+        if path2node:
+            # One path per line, written at once.
+            out.write("\n".join(path2node))
 
     def _output_nodes_longfmt(
         self, path2node: Mapping[str, DTNode], out: DTShOutput
@@ -147,20 +149,25 @@ class DTShBuiltinLs(DTShCommandLongFmt):
         path_expansions: Sequence[DTSh.PathExpansion],
         sh: DTSh,
     ) -> Mapping[str, Sequence[DTNode]]:
+        arg_fixed_depth = self.with_arg(DTShArgFixedDepth)
         mode_recursive = (
-            self.with_flag(DTShFlagRecursive)
-            or self.with_arg(DTShArgFixedDepth).isset
+            self.with_flag(DTShFlagRecursive) or arg_fixed_depth.isset
         )
+        # Walk options, resolved once for all branches.
+        order_by = self.arg_sorter
+        reverse = self.flag_reverse
+        enabled_only = self.flag_enabled_only
+        fixed_depth = arg_fixed_depth.depth
 
         path2contents: Dict[str, Sequence[DTNode]] = {}
         for expansion in path_expansions:
             for node in self.sort(expansion.nodes):
                 if mode_recursive:
                     for branch in node.walk(
-                        order_by=self.arg_sorter,
-                        reverse=self.flag_reverse,
-                        enabled_only=self.flag_enabled_only,
-                        fixed_depth=self.with_arg(DTShArgFixedDepth).depth,
+                        order_by=order_by,
+                        reverse=reverse,
+                        enabled_only=enabled_only,
+                        fixed_depth=fixed_depth,
                     ):
                         path = sh.pathway(branch, expansion.prefix)
                         path2contents[path] = self.sort(branch.children)
@@ -176,17 +183,21 @@ class DTShBuiltinLs(DTShCommandLongFmt):
     def _output_contents_raw(
         self, path2contents: Mapping[str, Sequence[DTNode]], out: DTShOutput
     ) -> None:
+        lines: List[str] = []
         N = len(path2contents)
         for i, (dirpath, contents) in enumerate(path2contents.items()):
             if N > 1:
-                out.write(f"{dirpath}:")
+                lines.append(f"{dirpath}:")
 
-            for node in contents:
-                out.write(node.name)
+            lines.extend(node.name for node in contents)
 
             if i != N - 1:
                 # Insert empty line between "directories".
-                out.write()
+                lines.append("")
+
+        if lines:
+            # Write all contents at once, one entry per line.
+            out.write("\n".join(lines))
 
     def _output_contents_longfmt(
         self,
@@ -10,7 +10,7 @@ Unit tests and examples: tests/test_dtsh_builtin_tree.py
 """
 
 
-from typing import Sequence, Mapping, Dict
+from typing import Sequence, Mapping, Dict, Optional, Union
 
 from dtsh.model import DTNode
 from dtsh.io import DTShOutput
@@ -29,7 +29,7 @@ from dtsh.rich.modelview import (
     ViewNodeTreePOSIX,
     ViewNodeTwoSided,
 )
-from dtsh.rich.shellutils import DTShCommandLongFmt
+from dtsh.rich.shellutils import DTShCommandLongFmt, DTShNodeFmt
 
 
 class DTShBuiltinTree(DTShCommandLongFmt):
@@ -63,23 +63,38 @@ class DTShBuiltinTree(DTShCommandLongFmt):
             path_expansions, sh
         )
 
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
+        cells: Optional[DTShNodeFmt.T] = None
+        if self.has_longfmt:
+            # Formatted columns, set up once for all branches.
+            sketch = self.get_sketch(SketchMV.Layout.TWO_SIDED)
+            cells = self.get_longfmt(sketch.default_fmt)
+        # Layout options, resolved once for all branches.
+        order_by = self.arg_sorter
+        reverse = self.flag_reverse
+        enabled_only = self.flag_enabled_only
+        fixed_depth = self.with_arg(DTShArgFixedDepth).depth
+
         N = len(path2branch)
         for i, (path, branch) in enumerate(path2branch.items()):
-            if self.has_longfmt:
+            view: Union[ViewNodeTwoSided, ViewNodeTreePOSIX]
+            if cells:
                 # Formatted output (2sided view).
-                self._output_longfmt(branch, out)
+                view = ViewNodeTwoSided(branch, cells)
             else:
                 # POSIX-like simple tree.
-                self._output_raw(path, branch, out)
+                view = ViewNodeTreePOSIX(path, branch)
+            view.do_layout(order_by, reverse, enabled_only, fixed_depth)
+            out.write(view)
 
             if i != N - 1:
                 # Insert empty line between trees.
                 out.write()
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def _get_path2branch(
@@ -94,27 +109,3 @@ class DTShBuiltinTree(DTShCommandLongFmt):
                 path2branch[path] = branch
 
         return path2branch
-
-    def _output_longfmt(self, branch: DTNode, out: DTShOutput) -> None:
-        # Formatted branch output (2-sided view).
-        sketch = self.get_sketch(SketchMV.Layout.TWO_SIDED)
-        cells = self.get_longfmt(sketch.default_fmt)
-        view_2sided = ViewNodeTwoSided(branch, cells)
-        view_2sided.do_layout(
-            self.arg_sorter,
-            self.flag_reverse,
-            self.flag_enabled_only,
-            self.with_arg(DTShArgFixedDepth).depth,
-        )
-        out.write(view_2sided)
-
-    def _output_raw(self, path: str, branch: DTNode, out: DTShOutput) -> None:
-        # Branch as tree (POSIX output).
-        tree = ViewNodeTreePOSIX(path, branch)
-        tree.do_layout(
-            self.arg_sorter,
-            self.flag_reverse,
-            self.flag_enabled_only,
-            self.with_arg(DTShArgFixedDepth).depth,
-        )
-        out.write(tree)
@@ -29,6 +29,13 @@ from dtsh.rich.tui import GridLayout, RenderableError
 _dtshconf: DTShConfig = DTShConfig.getinstance()
 
 
+def _mk_nickpath(path: str, base: Optional[str], nick: str) -> str:
+    # Substitute the base path prefix with its nickname, e.g. ZEPHYR_BASE.
+    if base and path.startswith(base):
+        return f"{nick}{path[len(base):]}"
+    return path
+
+
 class DTShFlagMachine(DTShFlag):
     """Flag"""
 
@@ -114,7 +121,8 @@ class DTShBuiltinUname(DTShCommand):
         """Overrides DTShCommand.execute()."""
         super().execute(argv, sh, out)
 
-        if self.with_flag(DTShFlagPager):
+        with_pager = self.with_flag(DTShFlagPager)
+        if with_pager:
             out.pager_enter()
 
         if self.with_flag(DTShFlagAll):
@@ -136,7 +144,7 @@ class DTShBuiltinUname(DTShCommand):
             # "uname"
             self._uname_default(sh.dt.dts, out)
 
-        if self.with_flag(DTShFlagPager):
+        if with_pager:
             out.pager_exit()
 
     def _uname_machine(self, dts: DTS, out: DTShOutput) -> None:
@@ -162,18 +170,20 @@ class DTShBuiltinUname(DTShCommand):
             self._uname_kernel_raw(dts, out)
 
     def _uname_kernel_raw(self, dts: DTS, out: DTShOutput) -> None:
-        out.write("Zephyr-RTOS", end=None)
+        # Assemble the line, then write it at once.
+        parts: List[str] = ["Zephyr-RTOS"]
         kernel_rev = dts.get_zephyr_head()
         if kernel_rev:
-            out.write(f" {kernel_rev}", end=None)
-        if dts.toolchain_variant:
+            parts.append(f" {kernel_rev}")
+        toolchain_variant = dts.toolchain_variant
+        if toolchain_variant:
             toolchain = (
                 "Zephyr SDK"
-                if dts.toolchain_variant == "zephyr"
-                else dts.toolchain_variant
+                if toolchain_variant == "zephyr"
+                else toolchain_variant
             )
-            out.write(f" ({toolchain})", end=None)
-        out.write()
+            parts.append(f" ({toolchain})")
+        out.write("".join(parts))
 
     def _uname_kernel_long(self, dts: DTS, out: DTShOutput) -> None:
         if dts.zephyr_base:
@@ -225,35 +235,36 @@ class DTShBuiltinUname(DTShCommand):
             self._uname_default_raw(dts, out)
 
     def _uname_default_raw(self, dts: DTS, out: DTShOutput) -> None:
-        out.write("Zephyr-RTOS", end=None)
+        # Assemble the line, then write it at once.
+        parts: List[str] = ["Zephyr-RTOS"]
         kernel_rel = dts.get_zephyr_head()
         if kernel_rel:
-            out.write(f" {kernel_rel}", end=None)
-        if dts.board:
-            out.write(f" - {dts.board}", end=None)
-        out.write()
+            parts.append(f" {kernel_rel}")
+        board = dts.board
+        if board:
+            parts.append(f" - {board}")
+        out.write("".join(parts))
 
     def _uname_default_long(self, dts: DTS, out: DTShOutput) -> None:
-        out.write(
-            TextUtil.mk_text("Zephyr-RTOS", DTShTheme.STYLE_INF_ZEPHYR_KERNEL),
-            end=None,
-        )
+        # Assemble the line, then write it at once.
+        parts: List[Union[Text, str]] = [
+            TextUtil.mk_text("Zephyr-RTOS", DTShTheme.STYLE_INF_ZEPHYR_KERNEL)
+        ]
         kernel_rel = dts.get_zephyr_head()
         if kernel_rel:
-            out.write(" ", end=None)
-            out.write(
+            parts.append(" ")
+            parts.append(
                 TextUtil.mk_text(
                     kernel_rel, style=DTShTheme.STYLE_INF_ZEPHYR_KERNEL
-                ),
-                end=None,
+                )
             )
-        if dts.board:
-            out.write(f" {_dtshconf.wchar_dash} ", end=None)
-            out.write(
-                TextUtil.mk_text(dts.board, style=DTShTheme.STYLE_INF_BOARD),
-                end=None,
+        board = dts.board
+        if board:
+            parts.append(f" {_dtshconf.wchar_dash} ")
+            parts.append(
+                TextUtil.mk_text(board, style=DTShTheme.STYLE_INF_BOARD)
             )
-        out.write()
+        out.write(TextUtil.assemble(*parts))
 
     def _uname_all(self, dts: DTS, out: DTShOutput) -> None:
         if self.with_flag(DTShFlagLongList):
@@ -418,7 +429,7 @@ class FormOperatingSystem(FormLayout):
 
     def _nickpath(self, path: str) -> str:
         # We know ZEPHYR_BASE is available.
-        return path.replace(self._dts.zephyr_base, "ZEPHYR_BASE")  # type: ignore
+        return _mk_nickpath(path, self._dts.zephyr_base, "ZEPHYR_BASE")
 
 
 class FormBoardInfo(FormLayout):
@@ -525,7 +536,7 @@ class FormBoardInfo(FormLayout):
 
     def _nickpath(self, path: str) -> str:
         # We know BOARD_DIR is available.
-        return path.replace(self._dts.board_dir, "BOARD_DIR")  # type: ignore
+        return _mk_nickpath(path, self._dts.board_dir, "BOARD_DIR")
 
 
 class FormSoCInfo(FormLayout):
@@ -634,6 +645,4 @@ class FormSoCInfo(FormLayout):
             )
 
     def _nickpath(self, path: str) -> str:
-        if self._dts.zephyr_base:
-            return path.replace(self._dts.zephyr_base, "ZEPHYR_BASE")
-        return path
+        return _mk_nickpath(path, self._dts.zephyr_base, "ZEPHYR_BASE")
@@ -38,6 +38,8 @@ from typing import (
     Iterator,
     Mapping,
     Tuple,
+    Type,
+    TypeVar,
 )
 
 import os
@@ -98,6 +100,10 @@ class DTS:
     _cmake: Optional["CMakeCache"]
     _yamlfs: "YAMLFilesystem"
 
+    # Git helper for ZEPHYR_BASE, initialized on first access,
+    # see get_zephyr_head().
+    _zephyr_git: Optional["GitUtil"]
+
     def __init__(
         self,
         dts_path: str,
@@ -119,6 +125,7 @@ class DTS:
         self._binding_dirs = self._init_binding_dirs(binding_dirs)
         self._vendors_file = self._init_vendors_file(vendors_file)
         self._yamlfs = YAMLFilesystem(self._binding_dirs)
+        self._zephyr_git = None
 
     @property
     def path(self) -> str:
@@ -231,8 +238,9 @@ class DTS:
 
         Unsupported for Zephyr Hardware Model v1.
         """
-        if self.board:
-            board_soc = self.board.split("/")
+        board = self.board
+        if board:
+            board_soc = board.split("/")
             if len(board_soc) == 2:
                 return board_soc[1]
         return None
@@ -243,9 +251,11 @@ class DTS:
 
         Shortcut to "${BOARD_DIR}/${BOARD}.dts".
         """
-        if self.board_dir and self.board:
-            board_sem = DTS._board_sem(self.board)
-            return os.path.join(self.board_dir, f"{board_sem}.dts")
+        board_dir = self.board_dir
+        board = self.board
+        if board_dir and board:
+            board_sem = DTS._board_sem(board)
+            return os.path.join(board_dir, f"{board_sem}.dts")
         return None
 
     @property
@@ -254,9 +264,11 @@ class DTS:
 
         Shortcut to "${BOARD_DIR}/${BOARD}.yaml".
         """
-        if self.board_dir and self.board:
-            board_sem = DTS._board_sem(self.board)
-            return os.path.join(self.board_dir, f"{board_sem}.yaml")
+        board_dir = self.board_dir
+        board = self.board
+        if board_dir and board:
+            board_sem = DTS._board_sem(board)
+            return os.path.join(board_dir, f"{board_sem}.yaml")
         return None
 
     @property
@@ -278,8 +290,9 @@ class DTS:
 
         Unsupported for Zephyr Hardware Model v1.
         """
-        if self.soc_dir:
-            return os.path.join(self.soc_dir, "soc.yml")
+        soc_dir = self.soc_dir
+        if soc_dir:
+            return os.path.join(soc_dir, "soc.yml")
         return None
 
     @property
@@ -395,7 +408,10 @@ class DTS:
             Depends on the git command availability.
         """
         if self.zephyr_base:
-            git = GitUtil(self.zephyr_base)
+            if self._zephyr_git is None:
+                # Check whether Git is available only once.
+                self._zephyr_git = GitUtil(self.zephyr_base)
+            git = self._zephyr_git
             if git.is_available:
                 head_short = git.head_get_short()
                 head_tag = git.head_get_tag()
@@ -566,7 +582,7 @@ class YAMLFilesystem:
             or None if not found.
         """
         path = self.find_path((name))
-        return YAMLFile(path) if path else None
+        return YAMLFile.cached(path) if path else None
 
 
 class CMakeCache:
@@ -841,6 +857,7 @@ class YAMLFile:
     - the file is opened and red when content() is first accessed
     - the file is parsed into YAML when raw() or includes() is first accessed
 
+    Wrappers obtained with cached() are shared until the file changes.
     """
 
     # Absolute file path.
@@ -860,6 +877,23 @@ class YAMLFile:
     # - YAMLError: invalid YAML content
     _lasterr: Optional[Union[OSError, yaml.YAMLError]]
 
+    @classmethod
+    def cached(cls, path: str) -> "YAMLFile":
+        """Get a shared wrapper around a YAML file.
+
+        The wrapper (and its lazy-initialized content and model)
+        is reused as long as the file's status (modification and change
+        times, size) doesn't change.
+        Wrappers that failed to read the file are never reused.
+
+        Args:
+            path: Absolute path to the YAML file.
+
+        Returns:
+            A possibly shared wrapper.
+        """
+        return _get_cached_file(cls, path)
+
     def __init__(self, path: str) -> None:
         """Lazy-initialize wrapper.
 
@@ -988,6 +1022,22 @@ class DTSFile:
     # If set, we've failed to load the DTS file (IO error).
     _lasterr: Optional[OSError]
 
+    @classmethod
+    def cached(cls, path: str) -> "DTSFile":
+        """Get a shared wrapper around a DTS file.
+
+        The wrapper is reused as long as the file's status
+        (modification and change times, size) doesn't change.
+        Wrappers that failed to read the file are never reused.
+
+        Args:
+            path: Absolute path to the DTS file.
+
+        Returns:
+            A possibly shared wrapper.
+        """
+        return _get_cached_file(cls, path)
+
     def __init__(self, path: str) -> None:
         """Initialize wrapper.
 
@@ -1032,6 +1082,46 @@ class DTSFile:
         return ""
 
 
+_CachedFileT = TypeVar("_CachedFileT", YAMLFile, DTSFile)
+
+# Shared file wrappers, see YAMLFile.cached() and DTSFile.cached():
+# (wrapper type, path) -> (file status, wrapper),
+# from least to most recently used.
+_cached_files: Dict[
+    Tuple[type, str], Tuple[Tuple[int, int, int], Union[YAMLFile, DTSFile]]
+] = {}
+_CACHED_FILES_MAX = 128
+
+
+def _get_cached_file(file_t: Type[_CachedFileT], path: str) -> _CachedFileT:
+    try:
+        st = os.stat(path)
+    except OSError:
+        # Not cached: the wrapper will answer the error.
+        return file_t(path)
+    # Identify a file version by its modification time, change time
+    # (e.g. permissions) and size.
+    stat_key = (st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+
+    key = (file_t, path)
+    entry = _cached_files.pop(key, None)
+    if (
+        entry
+        and entry[0] == stat_key
+        # Don't reuse I/O errors: try again with a new wrapper.
+        and not isinstance(entry[1].lasterr, OSError)
+    ):
+        fobj = cast(_CachedFileT, entry[1])
+    else:
+        fobj = file_t(path)
+
+    # (Re)insert as most recently used, evict the least recently used.
+    _cached_files[key] = (stat_key, fobj)
+    if len(_cached_files) > _CACHED_FILES_MAX:
+        del _cached_files[next(iter(_cached_files))]
+    return fobj
+
+
 class GitUtil:
     """Git helper.
 
@@ -878,6 +878,11 @@ class DTNodeProperty:
     _node: "DTNode"
     _edtprop: edtlib.Property
 
+    # The devicetree won't change once loaded:
+    # convert the edtlib value only once, on first access.
+    _value: "DTNodeProperty.ValueType"
+    _has_value: bool
+
     def __init__(self, edtprop: edtlib.Property, node: "DTNode") -> None:
         """Initialize node property.
 
@@ -887,6 +892,8 @@ class DTNodeProperty:
         """
         self._node = node
         self._edtprop = edtprop
+        self._value = None
+        self._has_value = False
 
     @property
     def node(self) -> "DTNode":
@@ -938,7 +945,32 @@ class DTNodeProperty:
         - For DT types "phandle": the pointed-to DTNode instance
         - For DT type "phandles": a list of the pointed-to DTNode instances
         - For DT type "phandle-array": a list of DTNodePHandleData
+
+        The value is shared: client code should not modify it.
         """
+        if not self._has_value:
+            self._value = self._mk_value()
+            self._has_value = True
+        return self._value
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DTNodeProperty):
+            return (self._node == other._node) and (self.name == other.name)
+        return False
+
+    def __repr__(self) -> str:
+        vlist: List[Any]
+        value = self.value
+        if isinstance(value, list):
+            vlist = value
+        else:
+            vlist = [value]
+        vstr = " ".join(
+            [hex(val) if isinstance(val, int) else str(val) for val in vlist]
+        )
+        return f"{self.name}: {vstr}"
+
+    def _mk_value(self) -> "DTNodeProperty.ValueType":
         if self._edtprop.val is None:
             return None
 
@@ -988,22 +1020,6 @@ class DTNodeProperty:
         # Unsupported property type.
         raise ValueError(self._edtprop.val)
 
-    def __eq__(self, other: object) -> bool:
-        if isinstance(other, DTNodeProperty):
-            return (self._node == other._node) and (self.name == other.name)
-        return False
-
-    def __repr__(self) -> str:
-        vlist: List[Any]
-        if isinstance(self.value, list):
-            vlist = self.value
-        else:
-            vlist = [self.value]
-        vstr = " ".join(
-            [hex(val) if isinstance(val, int) else str(val) for val in vlist]
-        )
-        return f"{self.name}: {vstr}"
-
 
 class DTWalkable:
     """Virtual devicetree we can walk through.
@@ -1070,7 +1086,15 @@ class DTNode(DTWalkable):
     _binding: Optional[DTBinding]
 
     # (All) properties, lazy initialized.
-    _props: Dict[str, DTNodeProperty]
+    _props: Optional[Dict[str, DTNodeProperty]]
+
+    # Path name: edtlib computes it by walking up to the root on each
+    # access, and nodes are hashed, compared and indexed by path.
+    _path: str
+
+    # Status string, lazy initialized: edtlib decodes the status property
+    # on each access, and walking enabled nodes only will ask for it often.
+    _status: Optional[str]
 
     def __init__(
         self,
@@ -1091,6 +1115,7 @@ class DTNode(DTWalkable):
               or None when creating the model's root.
         """
         self._edtnode = edtnode
+        self._path = edtnode.path
         self._dt = model
         # The devicetree root is its own parent.
         self._parent = parent or self
@@ -1099,7 +1124,8 @@ class DTNode(DTWalkable):
         # Device bindings are initialized on start-up.
         self._binding = self._dt.get_device_binding(self)
         # Initialized on first access.
-        self._props = {}
+        self._props = None
+        self._status = None
 
     @property
     def dt(self) -> "DTModel":
@@ -1109,7 +1135,7 @@ class DTNode(DTWalkable):
     @property
     def path(self) -> str:
         """The path name (DTSpec 2.2.3)."""
-        return self._edtnode.path
+        return self._path
 
     @property
     def name(self) -> str:
@@ -1142,7 +1168,9 @@ class DTNode(DTWalkable):
         to have values "okay", "disabled", "reserved", "fail", and "fail-sss",
         only the values "okay" and "disabled" are currently relevant to Zephyr.
         """
-        return self._edtnode.status
+        if self._status is None:
+            self._status = self._edtnode.status
+        return self._status
 
     @property
     def enabled(self) -> bool:
@@ -1153,7 +1181,7 @@ class DTNode(DTWalkable):
         """
         # edtlib.Node.status() has already substituted "ok" with "okay",
         # no need to test both values again.
-        return self._edtnode.status == "okay"
+        return self.status == "okay"
 
     @property
     def aliases(self) -> Sequence[str]:
@@ -1318,8 +1346,7 @@ class DTNode(DTWalkable):
         Returns:
             True if this node has a property with the requested name.
         """
-        self._init_props()
-        return name in self._props
+        return name in self._init_props()
 
     def dtproperty(self, name: str) -> DTNodeProperty:
         """Access node properties by name.
@@ -1332,8 +1359,7 @@ class DTNode(DTWalkable):
         Returns:
             True if this node has a property with the requested name.
         """
-        self._init_props()
-        return self._props[name]
+        return self._init_props()[name]
 
     def all_dtproperties(self) -> List[DTNodeProperty]:
         """Enumerate all node properties.
@@ -1341,8 +1367,7 @@ class DTNode(DTWalkable):
         Returns:
             A list client code can sort, filter, etc.
         """
-        self._init_props()
-        return list(self._props.values())
+        return list(self._init_props().values())
 
     def get_child(self, name: str) -> "DTNode":
         """Retrieve a child node by name.
@@ -1355,10 +1380,15 @@ class DTNode(DTWalkable):
         Returns:
             The requested child.
         """
-        for node in self._children:
-            if node.name == name:
-                return node
-        raise KeyError(name)
+        # Direct lookup in the model's path index,
+        # instead of scanning the children list.
+        try:
+            node = self._dt[DTPath.join(self.path, name)]
+        except KeyError as e:
+            raise KeyError(name) from e
+        if node.parent is not self or node.name != name:
+            raise KeyError(name)
+        return node
 
     def walk(
         self,
@@ -1446,67 +1476,69 @@ class DTNode(DTWalkable):
         reverse: bool,
         enabled_only: bool,
         fixed_depth: int,
-        at_depth: int = 0,
     ) -> Iterator["DTNode"]:
         if enabled_only and not node.enabled:
             # Abort early on disabled branches when enabled_only is set.
             return
 
-        # Yield branch and increment depth.
-        yield node
-        if fixed_depth > 0:
-            if at_depth == fixed_depth:
-                return
+        # Iterative pre-order traversal: an explicit stack of (node, depth)
+        # instead of nested generators, which would cost one frame
+        # per level for each yielded node.
+        stack: List[Tuple[DTNode, int]] = [(node, 0)]
+        while stack:
+            branch, at_depth = stack.pop()
+            # Yield branch and increment depth.
+            yield branch
+            if 0 < fixed_depth == at_depth:
+                continue
             at_depth += 1
 
-        # Filter and sort children.
-        children = node.children
-        if enabled_only:
-            children = [child for child in children if child.enabled]
-        if order_by:
-            children = order_by.sort(children, reverse=reverse)
-        elif reverse:
-            children = list(reversed(children))
+            # Filter and sort children.
+            children = branch.children
+            if enabled_only:
+                children = [child for child in children if child.enabled]
+            if order_by:
+                children = order_by.sort(children, reverse=reverse)
+            elif reverse:
+                # Reverse DTS-order: already the order in which to push.
+                stack.extend((child, at_depth) for child in children)
+                continue
 
-        for child in children:
-            yield from self._walk(
-                child,
-                order_by=order_by,
-                reverse=reverse,
-                enabled_only=enabled_only,
-                fixed_depth=fixed_depth,
-                at_depth=at_depth,
-            )
+            # Push children in reverse order so that the first is popped first.
+            stack.extend((child, at_depth) for child in reversed(children))
 
     def _rwalk(self, node: "DTNode") -> Iterator["DTNode"]:
         # Walk the subtree backward to the root node,
         # which is by convention its own parent.
         yield node
-        if node.parent != node:
-            yield from self._rwalk(node.parent)
+        while node.parent is not node:
+            node = node.parent
+            yield node
 
-    def _init_props(self) -> None:
-        if not self._props:
+    def _init_props(self) -> Dict[str, DTNodeProperty]:
+        # Nodes without properties are initialized only once too.
+        if self._props is None:
             self._props = {
                 edtprop.name: DTNodeProperty(edtprop, self)
                 for edtprop in self._edtnode.props.values()
             }
+        return self._props
 
     def __eq__(self, other: object) -> bool:
         if isinstance(other, DTNode):
-            return other.path == self.path
+            return other._path == self._path
         return False
 
     def __lt__(self, other: object) -> bool:
         if isinstance(other, DTNode):
-            return self.path < other.path
+            return self._path < other._path
         raise TypeError(other)
 
     def __hash__(self) -> int:
-        return hash(self.path)
+        return hash(self._path)
 
     def __repr__(self) -> str:
-        return self.path
+        return self._path
 
 
 class DTModel:
@@ -1933,26 +1965,25 @@ class DTModel:
 
     def _init_aliased_nodes(self) -> None:
         self._aliased_nodes.update(
-            {
-                alias: self[dtnode.path]
-                # NOTE[PR-edtlib]: Could we have something like EDT.aliased_nodes ?
-                for alias, dtnode in self._edt._dt.alias2node.items()  # pylint: disable=protected-access
-            }
+            (alias, self[dtnode.path])
+            # NOTE[PR-edtlib]: Could we have something like EDT.aliased_nodes ?
+            for alias, dtnode in self._edt._dt.alias2node.items()  # pylint: disable=protected-access
         )
 
     def _init_chosen_nodes(self) -> None:
         self._chosen_nodes.update(
-            {
-                chosen: self[edtnode.path]
-                for chosen, edtnode in self._edt.chosen_nodes.items()
-            }
+            (chosen, self[edtnode.path])
+            for chosen, edtnode in self._edt.chosen_nodes.items()
         )
 
     def _init_labeled_nodes(self) -> None:
-        for node, labels in [
-            (node_, node_.labels) for node_ in self._nodes.values()
-        ]:
-            self._labeled_nodes.update({label: node for label in labels})
+        # Feed the mapping with a single generator, rather than
+        # allocating intermediate lists and dictionaries per node.
+        self._labeled_nodes.update(
+            (label, node)
+            for node in self._nodes.values()
+            for label in node.labels
+        )
 
     def _get_compatless_binding(
         self, edtbinding: edtlib.Binding, cb_depth: int
@@ -14,10 +14,9 @@ Unit tests and examples: tests/test_dtsh_modelutils.py
 
 
 from typing import (
-    cast,
     Any,
-    Union,
     Callable,
+    Dict,
     Tuple,
     Set,
     List,
@@ -721,24 +720,33 @@ class DTWalkableComb(DTWalkable):
 
     def _walk(
         self,
-        branch: Optional[DTNode] = None,
+        branch: DTNode,
         /,
         order_by: Optional[DTNodeSorter] = None,
         reverse: bool = False,
     ) -> Iterator[DTNode]:
-        if branch in self._comb:
+        if branch not in self._comb:
+            return
+
+        # Iterative pre-order traversal, see DTNode.walk().
+        stack: List[DTNode] = [branch]
+        while stack:
+            branch = stack.pop()
             yield branch
-            children = branch.children
-            if children:
-                if order_by:
-                    children = order_by.sort(children, reverse=reverse)
-                elif reverse:
-                    # Reverse DTS-order.
-                    children = list(reversed(children))
-                for child in children:
-                    yield from self._walk(
-                        child, order_by=order_by, reverse=reverse
-                    )
+
+            # Only walk through children that belong to the comb.
+            children = [
+                child for child in branch.children if child in self._comb
+            ]
+            if order_by:
+                children = order_by.sort(children, reverse=reverse)
+            elif reverse:
+                # Reverse DTS-order: already the order in which to push.
+                stack.extend(children)
+                continue
+
+            # Push children in reverse order so that the first is popped first.
+            stack.extend(reversed(children))
 
 
 class DTSUtil:
@@ -766,46 +774,15 @@ class DTSUtil:
         """
         value: DTNodeProperty.ValueType = prop.value
 
+        # Dispatch on the Python type of the value (or of its first item),
+        # which identifies the DTS type, with a single dictionary look-up.
+        mk_value: Optional[Callable[[Any], str]]
         if isinstance(value, list):
-            val0: Union[int, str, DTNode, DTNodePHandleData, None] = value[0]
-
-            if isinstance(val0, int):
-                # DTS "type: array".
-                int_array: List[int] = cast(List[int], value)
-                return cls.mk_array(int_array)
-
-            if isinstance(val0, str):
-                # DTS "type: string-array".
-                str_array: List[str] = cast(List[str], value)
-                return cls.mk_string_array(str_array)
-
-            if isinstance(val0, DTNode):
-                # DTS "type: phandles".
-                phandles: List[DTNode] = cast(List[DTNode], value)
-                return cls.mk_phandles(phandles)
-
-            if isinstance(val0, DTNodePHandleData):
-                # DTS "type: phandle-array".
-                phandle_array: List[DTNodePHandleData] = cast(
-                    List[DTNodePHandleData], value
-                )
-                return cls.mk_phandle_array(phandle_array)
-
-        if isinstance(value, bool):
-            # DTS "type: boolean".
-            return cls.mk_boolean(value)
-        if isinstance(value, int):
-            # DTS "type: int".
-            return cls.mk_int(value, as_cell=True)
-        if isinstance(value, str):
-            # DTS "type: string".
-            return cls.mk_string(value)
-        if isinstance(value, bytes):
-            # DTS "type: uint8-array".
-            return cls.mk_bytes(value)
-        if isinstance(value, DTNode):
-            # DTS "type: phandle".
-            return cls.mk_phandle(value)
+            mk_value = _dts_array_factories.get(type(value[0]))
+        else:
+            mk_value = _dts_value_factories.get(type(value))
+        if mk_value:
+            return mk_value(value)
 
         # Answer empty string for properties with None value,
         # e.g. the "ranges" property of the /soc node, of type "compound".
@@ -993,3 +970,32 @@ class DTSUtil:
     @classmethod
     def _mk_cell(cls, content: str) -> str:
         return f"< {content} >"
+
+
+# DTS-like string factories for array values, by type of the first item,
+# see DTSUtil.mk_property_value().
+_dts_array_factories: Dict[type, Callable[[Any], str]] = {
+    # DTS "type: array".
+    int: DTSUtil.mk_array,
+    # DTS "type: string-array".
+    str: DTSUtil.mk_string_array,
+    # DTS "type: phandles".
+    DTNode: DTSUtil.mk_phandles,
+    # DTS "type: phandle-array".
+    DTNodePHandleData: DTSUtil.mk_phandle_array,
+}
+
+# DTS-like string factories for other values, by value type,
+# see DTSUtil.mk_property_value().
+_dts_value_factories: Dict[type, Callable[[Any], str]] = {
+    # DTS "type: boolean".
+    bool: DTSUtil.mk_boolean,
+    # DTS "type: int".
+    int: lambda value: DTSUtil.mk_int(value, as_cell=True),
+    # DTS "type: string".
+    str: DTSUtil.mk_string,
+    # DTS "type: uint8-array".
+    bytes: DTSUtil.mk_bytes,
+    # DTS "type: phandle".
+    DTNode: DTSUtil.mk_phandle,
+}
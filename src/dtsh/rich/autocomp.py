@@ -5,7 +5,7 @@
 """Rich display callback for GNU readline integration."""
 
 
-from typing import Optional, Sequence, Set
+from typing import Any, Callable, Dict, Optional, Sequence, Set, Type
 
 import os
 
@@ -13,6 +13,7 @@ from rich.text import Text
 
 from dtsh.io import DTShOutput
 from dtsh.rl import DTShReadline
+from dtsh.shell import DTSh
 from dtsh.autocomp import (
     DTShAutocomp,
     RlStateDTShCommand,
@@ -37,6 +38,35 @@ from dtsh.rich.tui import GridLayout
 class DTShRichAutocomp(DTShAutocomp):
     """Rich display callbacks for GNU readline integration."""
 
+    # Map completer state types to the methods that add them
+    # to the completions view: a dictionary look-up per state,
+    # rather than walking an isinstance() chain.
+    _rlstates_view_adders: Dict[
+        Type[DTShReadline.CompleterState], Callable[[GridLayout, Any], None]
+    ]
+
+    def __init__(self, sh: DTSh) -> None:
+        """Initialize the auto-completion helper.
+
+        Args:
+            sh: The context shell.
+        """
+        super().__init__(sh)
+        self._rlstates_view_adders = {
+            RlStateDTShCommand: self._rlstates_view_add_dtshcmd,
+            RlStateDTShOption: self._rlstates_view_add_dtshopt,
+            RlStateDTPath: self._rlstates_view_add_dtpath,
+            RlStateCompatStr: self._rlstates_view_add_compatstr,
+            RlStateDTVendor: self._rlstates_view_add_vendor,
+            RlStateDTBus: self._rlstates_view_add_bus,
+            RlStateDTAlias: self._rlstates_view_add_alias,
+            RlStateDTChosen: self._rlstates_view_add_chosen,
+            RlStateDTLabel: self._rlstates_view_add_label,
+            RlStateDTProperty: self._rlstates_view_add_dtprop,
+            RlStateFsEntry: self._rlstates_view_add_fspath,
+            RlStateEnum: self._rlstates_view_add_enum,
+        }
+
     def display(
         self,
         out: DTShOutput,
@@ -56,42 +86,9 @@ class DTShRichAutocomp(DTShAutocomp):
         grid = GridLayout(2, padding=(0, 4, 0, 0))
 
         for state in states:
-            if isinstance(state, RlStateDTShCommand):
-                self._rlstates_view_add_dtshcmd(grid, state)
-
-            elif isinstance(state, RlStateDTShOption):
-                self._rlstates_view_add_dtshopt(grid, state)
-
-            elif isinstance(state, RlStateDTPath):
-                self._rlstates_view_add_dtpath(grid, state)
-
-            elif isinstance(state, RlStateCompatStr):
-                self._rlstates_view_add_compatstr(grid, state)
-
-            elif isinstance(state, RlStateDTVendor):
-                self._rlstates_view_add_vendor(grid, state)
-
-            elif isinstance(state, RlStateDTBus):
-                self._rlstates_view_add_bus(grid, state)
-
-            elif isinstance(state, RlStateDTAlias):
-                self._rlstates_view_add_alias(grid, state)
-
-            elif isinstance(state, RlStateDTChosen):
-                self._rlstates_view_add_chosen(grid, state)
-
-            elif isinstance(state, RlStateDTLabel):
-                self._rlstates_view_add_label(grid, state)
-
-            elif isinstance(state, RlStateDTProperty):
-                self._rlstates_view_add_dtprop(grid, state)
-
-            elif isinstance(state, RlStateFsEntry):
-                self._rlstates_view_add_fspath(grid, state)
-
-            elif isinstance(state, RlStateEnum):
-                self._rlstates_view_add_enum(grid, state)
-
+            view_add = self._rlstates_view_adders.get(type(state))
+            if view_add:
+                view_add(grid, state)
             else:
                 grid.add_row(state.rlstr, None)
 
@@ -124,7 +121,7 @@ class DTShRichAutocomp(DTShAutocomp):
             # look for description.
             if len(state.bindings) == 1:
                 # Single binding, use its description if any.
-                binding = state.bindings.pop()
+                (binding,) = state.bindings
                 if binding.description:
                     txt_desc = TextUtil.mk_headline(
                         binding.description, DTShTheme.STYLE_DT_DESCRIPTION
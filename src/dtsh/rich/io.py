@@ -194,8 +194,9 @@ class DTShOutputFileText(DTShOutput):
         # Exported lines are padded up to the (maximum) console width:
         # strip these trailing whitespaces, which could make the text file
         # unreadable.
-        for line_nopad in (line.rstrip() for line in contents.splitlines()):
-            print(line_nopad, file=self._out)
+        self._out.writelines(
+            f"{line.rstrip()}\n" for line in contents.splitlines()
+        )
         self._out.close()
 
 
@@ -298,7 +299,7 @@ class DTShOutputFileHtml(DTShOutput):
 
             # Find command's output contents.
             for i, line in enumerate(html_lines):
-                if line.find("<pre") != -1:
+                if "<pre" in line:
                     i_output = i
                     break
 
@@ -19,7 +19,6 @@ from typing import (
     List,
     Generator,
     Mapping,
-    Dict,
     Tuple,
 )
 
@@ -27,7 +26,7 @@ import enum
 import os
 
 from rich import box
-from rich.console import RenderableType
+from rich.console import Group, RenderableType
 from rich.padding import PaddingDimensions, Padding
 from rich.style import StyleType
 from rich.syntax import Syntax
@@ -747,9 +746,6 @@ class ViewDTWalkable(View):
         Yields:
             The added nodes in order of traversal.
         """
-        # Map devicetree branches (nodes) to their Tree representation.
-        branch2tree: Dict[DTNode, Tree] = {}
-
         walker = self._walkable.walk(
             order_by=order_by,
             reverse=reverse,
@@ -764,12 +760,17 @@ class ViewDTWalkable(View):
             # Empty walk-able.
             return
         self._tree = Tree(self.mk_anchor(root))
-        branch2tree[root] = self._tree
         yield root
 
+        # Walks are pre-order: we only need the Tree representations
+        # of the current node's ancestors, bounded by the walk depth.
+        ancestors: List[Tuple[DTNode, Tree]] = [(root, self._tree)]
         for node in walker:
-            anchor = branch2tree[node.parent]
-            branch2tree[node] = anchor.add(self.mk_label(node))
+            parent = node.parent
+            while ancestors[-1][0] is not parent:
+                # Backtrack to the node's parent.
+                ancestors.pop()
+            ancestors.append((node, ancestors[-1][1].add(self.mk_label(node))))
             yield node
 
     def do_layout(
@@ -1435,12 +1436,14 @@ class ViewNodeAkaList(GridLayout):
         )
 
         grid_aka = GridLayout(2, padding=(0, 1, 0, 1))
+        # Get the arrow from the configuration once, not once per row.
+        arrow = _dtshconf.wchar_arrow_right
         for name in aka2node:
             text = TextUtil.mk_text(name, DTShTheme.STYLE_DT_ALIAS)
-            grid_aka.add_row(text, _dtshconf.wchar_arrow_right)
+            grid_aka.add_row(text, arrow)
 
         listview = ViewNodeList(cols, SketchMV(SketchMV.Layout.LIST_VIEW))
-        listview.extend(list(node for node in aka2node.values()))
+        listview.extend(aka2node.values())
 
         if _dtshconf.pref_list_headers:
             grid_aka.top_indent(2)
@@ -1454,6 +1457,15 @@ class DTTypesMV:
     This is a styled variant (aka rich) of the DTSUtil API.
     """
 
+    # Separators and delimiters shared by all values:
+    # Text.join() and Text.assemble() only read these.
+    _SEP_COMMA: Text = TextUtil.mk_text(", ")
+    _SEP_SPACE: Text = TextUtil.mk_text(" ")
+    _BYTES_OPEN: Text = TextUtil.mk_text("[ ")
+    _BYTES_CLOSE: Text = TextUtil.mk_text(" ]")
+    _CELL_OPEN: Text = TextUtil.mk_text("< ")
+    _CELL_CLOSE: Text = TextUtil.mk_text(" >")
+
     @classmethod
     def mk_value(cls, dtvalue: DTNodeProperty.ValueType) -> Text:
         """Make a styled text representation of a property value.
@@ -1590,9 +1602,9 @@ class DTTypesMV:
         """
         strbytes = " ".join(f"{b:02X}" for b in value)
         return TextUtil.assemble(
-            TextUtil.mk_text("[ "),
+            cls._BYTES_OPEN,
             TextUtil.mk_text(strbytes, DTShTheme.STYLE_DTVALUE_UINT8),
-            TextUtil.mk_text(" ]"),
+            cls._BYTES_CLOSE,
         )
 
     @classmethod
@@ -1639,7 +1651,7 @@ class DTTypesMV:
             return cls._mk_cell(txt_array)
 
         return TextUtil.join(
-            TextUtil.mk_text(", "),
+            cls._SEP_COMMA,
             (cls.mk_int(val, as_cell=True) for val in int_arr),
         )
 
@@ -1656,7 +1668,7 @@ class DTTypesMV:
             A styled text representation of the string array.
         """
         return TextUtil.join(
-            TextUtil.mk_text(", "), (cls.mk_string(val) for val in str_arr)
+            cls._SEP_COMMA, (cls.mk_string(val) for val in str_arr)
         )
 
     @classmethod
@@ -1672,7 +1684,7 @@ class DTTypesMV:
             A styled text representation of the "phandles" value.
         """
         txt_phandles = TextUtil.join(
-            TextUtil.mk_text(" "),
+            cls._SEP_SPACE,
             [cls.mk_phandle(node, as_cell=False) for node in phandles],
         )
         return cls._mk_cell(txt_phandles)
@@ -1690,7 +1702,7 @@ class DTTypesMV:
             A styled text representation of the "phandle-array" value.
         """
         return TextUtil.join(
-            TextUtil.mk_text(", "),
+            cls._SEP_COMMA,
             (
                 cls.mk_phandle_data(entry, as_cell=True)
                 for entry in phandle_array
@@ -1717,7 +1729,7 @@ class DTTypesMV:
         ]
 
         txt_phdata = TextUtil.join(
-            TextUtil.mk_text(" "),
+            cls._SEP_SPACE,
             [
                 cls.mk_phandle(phdata.phandle, as_cell=False),
                 TextUtil.mk_text(
@@ -1732,9 +1744,7 @@ class DTTypesMV:
 
     @classmethod
     def _mk_cell(cls, content: Text) -> Text:
-        return TextUtil.assemble(
-            TextUtil.mk_text("< "), content, TextUtil.mk_text(" >")
-        )
+        return TextUtil.assemble(cls._CELL_OPEN, content, cls._CELL_CLOSE)
 
 
 class NodePropertyMV:
@@ -1978,12 +1988,16 @@ class ViewPropertyValueTable(TableLayout):
             no_wrap=False,
         )
 
-        for dtprop in dtprops:
-            self.add_row(
+        # Make all rows first, then add them at once.
+        rows = [
+            (
                 NodePropertyMV.mk_name(dtprop, link_spec=True),
                 NodePropertyMV.mk_type(dtprop),
                 NodePropertyMV.mk_value(dtprop),
             )
+            for dtprop in dtprops
+        ]
+        self.add_rows(rows)
 
 
 class ViewDescription(View):
@@ -2309,8 +2323,8 @@ class ViewYAMLFile(View):
         Raises:
             RenderableError: Inaccessible or malformed YAML file.
         """
-        # Lazy initialized.
-        fyaml = YAMLFile(path)
+        # Lazy initialized, shared until the file changes.
+        fyaml = YAMLFile.cached(path)
         # Actually read and parse file content.
         fyaml.raw  # pylint: disable=pointless-statement
 
@@ -2464,21 +2478,7 @@ class HeadingsContentWriter:
             content: Renderable content.
             out: Where to write the content.
         """
-        if self._newl:
-            out.write()
-        else:
-            # Once this heading is written,
-            # we'll need to insert new lines between subsequent ones.
-            self._newl = True
-
-        i_left: int = self._tab + (self._tab // 2) * (level - 1)
-        if isinstance(content, View):
-            content.left_indent(i_left)
-        else:
-            content = Padding(content, (0, 0, 0, i_left))
-
-        out.write(TextUtil.bold(title.upper()))
-        out.write(content)
+        out.write(Group(*self._mk_renderables(title, level, content)))
 
     def write_section(
         self,
@@ -2504,8 +2504,42 @@ class HeadingsContentWriter:
             sections: What to write.
             out: Where to write.
         """
+        # Build all headings and contents first,
+        # then print them with a single console write.
+        renderables: List[RenderableType] = []
         for section in sections:
-            self.write_section(section, out)
+            renderables.extend(
+                self._mk_renderables(
+                    section.title, section.level, section.content
+                )
+            )
+        if renderables:
+            out.write(Group(*renderables))
+
+    def _mk_renderables(
+        self,
+        title: str,
+        level: int,
+        content: "HeadingsContentWriter.ContentType",
+    ) -> List[RenderableType]:
+        renderables: List[RenderableType] = []
+        if self._newl:
+            # Shared blank line.
+            renderables.append(View.SUB)
+        else:
+            # Once this heading is written,
+            # we'll need to insert new lines between subsequent ones.
+            self._newl = True
+
+        i_left: int = self._tab + (self._tab // 2) * (level - 1)
+        if isinstance(content, View):
+            content.left_indent(i_left)
+        else:
+            content = Padding(content, (0, 0, 0, i_left))
+
+        renderables.append(TextUtil.bold(title.upper()))
+        renderables.append(content)
+        return renderables
 
 
 class ViewDTSContent(View):
@@ -2570,7 +2604,7 @@ class ViewDTSFile(GridLayout):
             RenderableError: Inaccessible DTS file.
         """
         # Open and read DTS file.
-        fdts = DTSFile(path)
+        fdts = DTSFile.cached(path)
 
         if fdts.lasterr:
             raise RenderableError("Inaccessible DTS file", path, fdts.lasterr)
@@ -12,7 +12,7 @@ Unit tests and examples: tests/test_dtsh_rich_shellutils.py
 """
 
 
-from typing import Optional, Sequence, List, Mapping
+from typing import Optional, Sequence, List, Mapping, Dict, Tuple
 
 import sys
 
@@ -62,6 +62,10 @@ from dtsh.rich.modelview import (
 
 _dtshconf: DTShConfig = DTShConfig.getinstance()
 
+# Memoized node output formats, see DTShNodeFmt.parse():
+# format string -> columns.
+_parsed_fmts: Dict[str, Tuple[NodeColumnMV, ...]] = {}
+
 
 class DTShFlagLongList(DTShFlag):
     """Whether to use a long listing format."""
@@ -142,10 +146,15 @@ class DTShNodeFmt:
         Returns:
             The format columns (view factories).
         """
-        try:
-            return [DTSH_NODE_FMT_SPEC[spec].col for spec in fmt]
-        except KeyError as e:
-            raise DTShError(f"invalid format specifier: '{e}'") from e
+        cols = _parsed_fmts.get(fmt)
+        if cols is None:
+            try:
+                cols = tuple(DTSH_NODE_FMT_SPEC[spec].col for spec in fmt)
+            except KeyError as e:
+                raise DTShError(f"invalid format specifier: '{e}'") from e
+            _parsed_fmts[fmt] = cols
+        # Parsed formats are memoized: answer a new list of columns.
+        return list(cols)
 
     @staticmethod
     def is_valid(fmt: str) -> bool:
@@ -254,32 +263,23 @@ class DTShCommandLongFmt(DTShCommand):
     @property
     def flag_reverse(self) -> bool:
         """Shortcut to the "reverse output" flag if supported."""
-        try:
-            return self.with_flag(DTShFlagReverse)
-        except KeyError:
-            # Option not supported.
-            pass
-        return False
+        # Option may be unsupported.
+        flag = self.get_option(DTShFlagReverse)
+        return flag.isset if flag else False
 
     @property
     def arg_sorter(self) -> Optional[DTNodeSorter]:
         """Shortcut to the "order-by" argument's value if supported."""
-        try:
-            return self.with_arg(DTShArgOrderBy).sorter
-        except KeyError:
-            # Option not supported.
-            pass
-        return None
+        # Option may be unsupported.
+        arg = self.get_option(DTShArgOrderBy)
+        return arg.sorter if arg else None
 
     @property
     def flag_enabled_only(self) -> bool:
         """Shortcut to the "ennabled only" flag if supported."""
-        try:
-            return self.with_flag(DTShFlagEnabledOnly)
-        except KeyError:
-            # Option not supported.
-            pass
-        return False
+        # Option may be unsupported.
+        flag = self.get_option(DTShFlagEnabledOnly)
+        return flag.isset if flag else False
 
     def sort(self, nodes: Sequence[DTNode]) -> Sequence[DTNode]:
         """Sort nodes if the "order-by" argument is set
@@ -291,9 +291,11 @@ class DTShCommandLongFmt(DTShCommand):
         Returns:
             The sorted nodes.
         """
-        if self.arg_sorter:
-            return self.arg_sorter.sort(nodes, reverse=self.flag_reverse)
-        if self.flag_reverse:
+        sorter = self.arg_sorter
+        reverse = self.flag_reverse
+        if sorter:
+            return sorter.sort(nodes, reverse=reverse)
+        if reverse:
             return list(reversed(nodes))
         return nodes
 
@@ -346,7 +348,7 @@ class DTShCommandLongFmt(DTShCommand):
                     file=sys.stderr,
                 )
 
-        return cols or [DTShNodeFmt.parse("p")[0]]
+        return cols or DTShNodeFmt.parse("p")
 
 
 DTSH_NODE_FMT_SPEC: Mapping[str, DTShNodeFmt.Spec] = {
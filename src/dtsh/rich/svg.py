@@ -500,9 +500,9 @@ class SVGContentsFmt:
             The index of the first contents line where the mark is found,
             or -1 if not found.
         """
-        for i, line in enumerate(contents[start:]):
-            if line.find(mark) != -1:
-                return i + start
+        for i in range(start, len(contents)):
+            if mark in contents[i]:
+                return i
         return -1
 
     @classmethod
@@ -8,7 +8,7 @@ Factories for styled and actionable (aka linked) rich text views,
 and miscellaneous text related helpers.
 """
 
-from typing import Optional, Union, Iterable
+from typing import Dict, Optional, Union, Iterable
 
 from urllib.parse import urlparse
 import os
@@ -24,6 +24,13 @@ from dtsh.rich.theme import DTShTheme
 
 _dtshconf: DTShConfig = DTShConfig.getinstance()
 
+# Link destinations, as URIs: views typically link many texts
+# (e.g. all properties of a node) to the same few binding files.
+# Only URIs that don't depend on the current working directory,
+# from least to most recently used.
+_link_uris: Dict[str, str] = {}
+_LINK_URIS_MAX = 256
+
 
 class TextUtil:
     """Text view factories."""
@@ -168,10 +175,7 @@ class TextUtil:
         if linktype is ActionableType.NONE:
             return text
 
-        scheme = urlparse(uri).scheme
-        if not scheme:
-            # Assume "file" URI scheme when missing.
-            uri = pathlib.Path(os.path.abspath(uri)).as_uri()
+        uri = cls._mk_link_uri(uri)
 
         if linktype is ActionableType.ALT:
             # Append actionable text.
@@ -263,3 +267,21 @@ class TextUtil:
         # Note: Text.append_tokens(), Text.append_text() and such
         # would "merge" the Text styles.
         return Text.assemble(*parts)
+
+    @classmethod
+    def _mk_link_uri(cls, uri: str) -> str:
+        link_uri = _link_uris.pop(uri, None)
+        if link_uri is None:
+            link_uri = uri
+            scheme = urlparse(uri).scheme
+            if not scheme:
+                # Assume "file" URI scheme when missing.
+                link_uri = pathlib.Path(os.path.abspath(uri)).as_uri()
+                if not os.path.isabs(uri):
+                    # Relative to the current working directory.
+                    return link_uri
+        _link_uris[uri] = link_uri
+        if len(_link_uris) > _LINK_URIS_MAX:
+            # Evict least recently used.
+            del _link_uris[next(iter(_link_uris))]
+        return link_uri
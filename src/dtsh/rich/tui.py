@@ -8,7 +8,7 @@ Base view definitions compatible with the rich console protocol, __rich__().
 """
 
 
-from typing import Optional, Union, Sequence
+from typing import Iterable, Optional, Union, Sequence
 
 import rich.box
 from rich.console import RenderableType
@@ -195,6 +195,21 @@ class TableLayout(View):
             )
         self._table.add_row(*views)
 
+    def add_rows(
+        self, rows: Iterable[Sequence[Optional[RenderableType]]]
+    ) -> None:
+        """Add rows to this table layout.
+
+        Args:
+            rows: The rows to add, each a sequence of render-able columns.
+        """
+        ncols = len(self._table.columns)
+        add_row = self._table.add_row
+        for views in rows:
+            if ncols != len(views):
+                raise ValueError(f"Expected {ncols} views, got {len(views)}")
+            add_row(*views)
+
 
 class StatusBar(GridLayout):
     """Status bar view.
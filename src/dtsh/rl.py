@@ -63,6 +63,11 @@ class DTShReadline:
         States are initialized by the RL completion hook callback.
         """
 
+        # Completions may produce many states, which don't need
+        # a per-instance dictionary: derived classes should also
+        # declare their (possibly empty) slots.
+        __slots__ = ("_rlstr", "_item")
+
         _rlstr: str
         _item: Optional[object]
 
@@ -147,6 +152,9 @@ class DTShReadline:
     # Completer states, See rl_complete().
     _completer_states: List["DTShReadline.CompleterState"]
 
+    # Substitution strings of the completer states, See rl_complete().
+    _completer_rlstrs: List[str]
+
     # Where to display completion matches and restore the command line.
     _stdout: DTShOutput
 
@@ -171,6 +179,7 @@ class DTShReadline:
         """
         self._stdout = stdout
         self._completer_states = []
+        self._completer_rlstrs = []
         self._completion_callback = completion_callback
         self._display_callback = display_callback
 
@@ -221,8 +230,6 @@ class DTShReadline:
               candidates.
         """
         if state == 0:
-            self._completer_states.clear()
-
             rlbuf = readline.get_line_buffer()
             begin = readline.get_begidx()
             end = readline.get_endidx()
@@ -230,9 +237,12 @@ class DTShReadline:
             self._completer_states = self._completion_callback(
                 cs_txt, rlbuf, begin, end
             )
+            # Readline will then iterate on the substitution strings,
+            # calling this hook once per candidate: get them once.
+            self._completer_rlstrs = [cs.rlstr for cs in self._completer_states]
 
         try:
-            return self._completer_states[state].rlstr
+            return self._completer_rlstrs[state]
         except IndexError:
             # No completion.
             pass
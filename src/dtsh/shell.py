@@ -83,8 +83,17 @@ class DTShOption:
     Constant to be defined by concrete options that accept a long getopt form.
     """
 
+    # See shortform().
+    _shortform: Optional[str]
+
+    # See longform().
+    _longform: Optional[str]
+
     def __init__(self) -> None:
         """Initialize the command option, reset state."""
+        # Option names won't change, neither will their lexical forms.
+        self._shortform = f"-{self.shortname}" if self.shortname else None
+        self._longform = f"--{self.longname}" if self.longname else None
         self.reset()
 
     @property
@@ -97,6 +106,16 @@ class DTShOption:
         """Long option name (without the "--" prefix)."""
         return type(self).LONGNAME
 
+    @property
+    def shortform(self) -> Optional[str]:
+        """Short option lexical form (e.g. "-h"), if any."""
+        return self._shortform
+
+    @property
+    def longform(self) -> Optional[str]:
+        """Long option lexical form (e.g. "--help"), if any."""
+        return self._longform
+
     @property
     def brief(self) -> Optional[str]:
         """Brief description."""
@@ -135,10 +154,10 @@ class DTShOption:
         the usage is post-fixed with the argument's name, see DTShArg.usage().
         """
         tokens = []
-        if self.shortname:
-            tokens.append(f"-{self.shortname}")
-        if self.longname:
-            tokens.append(f"--{self.longname}")
+        if self._shortform:
+            tokens.append(self._shortform)
+        if self._longform:
+            tokens.append(self._longform)
         return " ".join(tokens)
 
     @property
@@ -469,6 +488,20 @@ class DTShCommand:
     # See options().
     _options: List[DTShOption]
 
+    # Map option lexical forms (e.g. "-h" and "--help") to options,
+    # initialized on first access, see option().
+    _options_by_form: Optional[Dict[str, DTShOption]]
+
+    # Map option types to options (or None if unsupported),
+    # filled on access, see get_option().
+    _options_by_type: Dict[Type[DTShOption], Optional[DTShOption]]
+
+    # GNU getopt specifications and synopsis,
+    # initialized on first access.
+    _getopt_short: Optional[str]
+    _getopt_long: Optional[List[str]]
+    _synopsis: Optional[str]
+
     # See param().
     _param: Optional[DTShParameter]
 
@@ -491,6 +524,12 @@ class DTShCommand:
         self._brief = brief
         self._options = list(options) if options else []
         self._options.insert(0, DTShFlagHelp())
+        # Derived classes may still append options.
+        self._options_by_form = None
+        self._options_by_type = {}
+        self._getopt_short = None
+        self._getopt_long = None
+        self._synopsis = None
         self._param = parameter
 
     @property
@@ -520,13 +559,15 @@ class DTShCommand:
     @property
     def synopsis(self) -> str:
         """The command's synopsis."""
-        tokens = [self._name]
-        for opt in self._options:
-            # All [option]s are optional (sic).
-            tokens.append(f"[{opt.usage}]")
-        if self._param:
-            tokens.append(self._param.usage)
-        return " ".join(tokens)
+        if self._synopsis is None:
+            tokens = [self._name]
+            for opt in self._options:
+                # All [option]s are optional (sic).
+                tokens.append(f"[{opt.usage}]")
+            if self._param:
+                tokens.append(self._param.usage)
+            self._synopsis = " ".join(tokens)
+        return self._synopsis
 
     @property
     def getopt_short(self) -> str:
@@ -535,11 +576,17 @@ class DTShCommand:
         E.g. "hL:" for a command that supports a flag "-h"
         and an argument "-L".
         """
-        return "".join(
-            # getopt_short should be defined, the or clause is added
-            # for type hinting consistency.
-            [opt.getopt_short or "" for opt in self._options if opt.shortname]
-        )
+        if self._getopt_short is None:
+            self._getopt_short = "".join(
+                # getopt_short should be defined, the or clause is added
+                # for type hinting consistency.
+                [
+                    opt.getopt_short or ""
+                    for opt in self._options
+                    if opt.shortname
+                ]
+            )
+        return self._getopt_short
 
     @property
     def getopt_long(self) -> List[str]:
@@ -548,9 +595,13 @@ class DTShCommand:
         E.g. ["help", "depth="] for a command that supports a flag "--help",
         and an argument "--depth <depth>".
         """
-        # getopt_long should be defined, the or clause is added
-        # for type hinting consistency.
-        return [opt.getopt_long or "" for opt in self._options if opt.longname]
+        if self._getopt_long is None:
+            # getopt_long should be defined, the or clause is added
+            # for type hinting consistency.
+            self._getopt_long = [
+                opt.getopt_long or "" for opt in self._options if opt.longname
+            ]
+        return self._getopt_long
 
     def option(self, name: str) -> Optional[DTShOption]:
         """Retrieve command options by lexical name.
@@ -562,17 +613,15 @@ class DTShCommand:
         Returns:
             The searched for command's option, None if not found.
         """
-        if name.startswith("--"):
-            longname = name[2:]
-            for opt in self._options:
-                if longname == opt.longname:
-                    return opt
-        elif name.startswith("-"):
-            shortname = name[1:]
+        if self._options_by_form is None:
+            self._options_by_form = {}
             for opt in self._options:
-                if shortname == opt.shortname:
-                    return opt
-        return None
+                # Should options share a name, the first one wins.
+                if opt.shortform:
+                    self._options_by_form.setdefault(opt.shortform, opt)
+                if opt.longform:
+                    self._options_by_form.setdefault(opt.longform, opt)
+        return self._options_by_form.get(name)
 
     def with_option(self, option_t: Type[DTShOptionT]) -> DTShOptionT:
         """Polymorphic access to the command options.
@@ -584,14 +633,32 @@ class DTShCommand:
         Returns:
             The command's option downcast to its specialized type.
         """
-        opt = None
-        if option_t.SHORTNAME:
-            opt = self.option(f"-{option_t.SHORTNAME}")
-        elif option_t.LONGNAME:
-            opt = self.option(f"--{option_t.LONGNAME}")
+        opt = self.get_option(option_t)
         if not opt:
             raise KeyError(option_t)
-        return cast(DTShOptionT, opt)
+        return opt
+
+    def get_option(self, option_t: Type[DTShOptionT]) -> Optional[DTShOptionT]:
+        """Polymorphic access to the command options, if supported.
+
+        Args:
+            option_t: The option type.
+
+        Returns:
+            The command's option downcast to its specialized type,
+            or None if the command does not support this option type.
+        """
+        try:
+            opt = self._options_by_type[option_t]
+        except KeyError:
+            # First access for this option type.
+            opt = None
+            if option_t.SHORTNAME:
+                opt = self.option(f"-{option_t.SHORTNAME}")
+            elif option_t.LONGNAME:
+                opt = self.option(f"--{option_t.LONGNAME}")
+            self._options_by_type[option_t] = opt
+        return cast(Optional[DTShOptionT], opt)
 
     def with_flag(self, flag_t: Type[DTShFlag]) -> bool:
         """Access a flag state.
@@ -788,6 +855,11 @@ class DTSh:
     # See cwd().
     _cwd: DTNode
 
+    # Resolved path names, relative to the current working branch,
+    # from least to most recently used, see realpath().
+    _realpaths: Dict[str, str]
+    _REALPATHS_MAX = 256
+
     def __init__(
         self,
         dt: DTModel,
@@ -803,6 +875,7 @@ class DTSh:
         """
         self._dt = dt
         self._cwd = self._dt.root
+        self._realpaths = {}
         self._commands = {cmd.name: cmd for cmd in builtins}
 
     @property
@@ -838,16 +911,27 @@ class DTSh:
         Raises:
             DTPathNotFoundError: Failed to resolve a devicetree label.
         """
-        m = DTSh._re_labelref.match(path)
-        if m and m.group("labelref"):
-            labelref = m.group("labelref")
-            label = labelref[1:]
-            try:
-                node = self._dt.labeled_nodes[label]
-                path = path.replace(m.group("labelref"), node.path, 1)
-            except KeyError as e:
-                raise DTPathNotFoundError(labelref) from e
-        return DTPath.abspath(path, self._cwd.path)
+        # Commands and auto-completion often resolve the same paths
+        # again and again: remember the most recently used ones
+        # until the working branch changes.
+        realpath = self._realpaths.pop(path, None)
+        if realpath is None:
+            realpath = path
+            m = DTSh._re_labelref.match(path)
+            if m and m.group("labelref"):
+                labelref = m.group("labelref")
+                label = labelref[1:]
+                try:
+                    node = self._dt.labeled_nodes[label]
+                    realpath = path.replace(m.group("labelref"), node.path, 1)
+                except KeyError as e:
+                    raise DTPathNotFoundError(labelref) from e
+            realpath = DTPath.abspath(realpath, self._cwd.path)
+        self._realpaths[path] = realpath
+        if len(self._realpaths) > DTSh._REALPATHS_MAX:
+            # Evict least recently used.
+            del self._realpaths[next(iter(self._realpaths))]
+        return realpath
 
     def pathway(self, node: DTNode, prefix: str) -> str:
         """Get the pathway from an origin to a node.
@@ -935,22 +1019,20 @@ class DTSh:
             pattern = f"^{pattern}$"
             re_basename = re.compile(pattern)
 
-            # Path expansion.
-            globs = [
-                node
-                for node in self.node_at(dirname).children
-                if re_basename.match(node.name)
-            ]
-            if not globs:
+            # Path expansion, filtering out disabled nodes
+            # if asked to: single pass, no intermediate list.
+            nodes = []
+            globbed = False
+            for node in self.node_at(dirname).children:
+                if re_basename.match(node.name):
+                    globbed = True
+                    if node.enabled or not enabled_only:
+                        nodes.append(node)
+            if not globbed:
                 # We consider empty expansions as "path not found" errors,
                 # like most Un*x shells do.
                 raise DTPathNotFoundError(path)
 
-            if enabled_only:
-                nodes = [node for node in globs if node.enabled]
-            else:
-                nodes = globs
-
         else:
             prefix = path or "."
             nodes = [self.node_at(path)]
@@ -991,6 +1073,8 @@ class DTSh:
             DTPathNotFoundError: The destination branch does not exist.
         """
         self._cwd = self.node_at(path) if path else self.dt.root
+        # Relative paths now resolve from the new working branch.
+        self._realpaths.clear()
 
     def find(
         self,
@@ -1104,10 +1188,10 @@ class DTSh:
         ]
 
         cmd_name = v_cmdline[0]
-        try:
-            cmd = self._commands[cmd_name]
-        except KeyError as e:
-            raise DTShCommandNotFoundError(cmd_name) from e
+        # Single dictionary lookup, also answering unknown commands.
+        cmd = self._commands.get(cmd_name)
+        if cmd is None:
+            raise DTShCommandNotFoundError(cmd_name)
 
         cmd_argc = 0
         expect_val = False
@@ -861,12 +861,9 @@ class DTShParamDTPaths(DTShParameter):
         Raises:
             DTShCommandError: Path expansion failed (node not found).
         """
-        enabled_only: bool = False
-        try:
-            enabled_only = cmd.with_flag(DTShFlagEnabledOnly)
-        except KeyError:
-            # Unsupported option, no filter.
-            enabled_only = False
+        # Unsupported option, no filter.
+        flag_enabled_only = cmd.get_option(DTShFlagEnabledOnly)
+        enabled_only = flag_enabled_only.isset if flag_enabled_only else False
 
         try:
             return [
@@ -952,10 +949,11 @@ class DTShParamDTPathX(DTShParameter):
             props: List[DTNodeProperty]
 
             if self._parm_prop.endswith("*"):
+                prefix = self._parm_prop[:-1]
                 props = [
                     prop
                     for prop in node.all_dtproperties()
-                    if prop.name.startswith(self._parm_prop[:-1])
+                    if prop.name.startswith(prefix)
                 ]
             else:
                 if node.has_dtproperty(self._parm_prop):
@@ -982,11 +980,12 @@ class DTShParamDTPathX(DTShParameter):
         # - PROP: None if XPATH is a node path,
         #   or a possibly empty property name (XPATH = PROP$)
         #   that client code should interpret as an error
-        i_prop = self.xpath.rfind("$")
-        if i_prop != -1:
-            return (self.xpath[:i_prop], self.xpath[i_prop + 1 :])
+        path, sep, prop = self.xpath.rpartition("$")
+        if sep:
+            return (path, prop)
 
-        return (self.xpath, None)
+        # No "$": rpartition() answers the whole string as last item.
+        return (prop, None)
 
 
 class DTShParamAlias(DTShParameter):
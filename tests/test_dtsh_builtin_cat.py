@@ -8,8 +8,10 @@
 # pylint: disable=missing-function-docstring
 
 
+import pytest
+
 from dtsh.io import DTShOutput
-from dtsh.shell import DTSh
+from dtsh.shell import DTSh, DTShCommandError
 from dtsh.builtins.cat import DTShBuiltinCat
 
 from .dtsh_uthelpers import DTShTests
@@ -34,3 +36,21 @@ def test_dtsh_builtin_cat_execute() -> None:
     sh = DTSh(DTShTests.get_sample_dtmodel(), [cmd])
 
     DTShTests.check_cmd_execute(cmd, sh, out)
+
+
+def test_dtsh_builtin_cat_options() -> None:
+    out = DTShOutput()
+    cmd = DTShBuiltinCat()
+    sh = DTSh(DTShTests.get_sample_dtmodel(), [cmd])
+
+    # Globbing properties does not support '-DBYA'.
+    for opt in ("-D", "-B", "-Y", "-A"):
+        with pytest.raises(DTShCommandError):
+            cmd.execute([opt, "/soc/i2c@40003000$reg*"], sh, out)
+
+    # POSIX-like output supports only one of '-DBY'.
+    with pytest.raises(DTShCommandError):
+        cmd.execute(["-DB", "/soc/i2c@40003000"], sh, out)
+    with pytest.raises(DTShCommandError):
+        cmd.execute(["-DB", "/soc/i2c@40003000$reg"], sh, out)
+    cmd.execute(["-lDB", "/soc/i2c@40003000"], sh, out)
@@ -12,10 +12,11 @@
 from typing import Optional
 
 import os
+from pathlib import Path
 
 import pytest
 
-from dtsh.dts import DTS, CMakeCache, YAMLFilesystem, YAMLFile
+from dtsh.dts import DTS, CMakeCache, YAMLFilesystem, YAMLFile, DTSFile
 
 from .dtsh_uthelpers import DTShTests
 
@@ -348,3 +349,53 @@ def test_yamlfile() -> None:
     assert "" == yaml.content
     assert {} == yaml.raw
     assert [] == yaml.includes
+
+
+def test_yamlfile_cached(tmp_path: Path) -> None:
+    path = DTShTests.get_resource_path("yaml", "i2c-device.yaml")
+    yaml = YAMLFile.cached(path)
+    assert yaml is YAMLFile.cached(path)
+    assert "i2c" == yaml.raw["on-bus"]
+
+    # Not shared once the file has changed.
+    tmp_yaml = tmp_path / "tmp.yaml"
+    tmp_yaml.write_text("on-bus: i2c\n")
+    yaml = YAMLFile.cached(str(tmp_yaml))
+    assert "i2c" == yaml.raw["on-bus"]
+    tmp_yaml.write_text("on-bus: spi\ncompatible: mock\n")
+    yaml = YAMLFile.cached(str(tmp_yaml))
+    assert "spi" == yaml.raw["on-bus"]
+
+    # Fail-safe, not cached.
+    assert "" == YAMLFile.cached("notafile").content
+
+
+def test_cached_files_oserror(tmp_path: Path) -> None:
+    # Paths we can stat() but not read: I/O errors are never reused.
+    yaml = YAMLFile.cached(str(tmp_path))
+    assert "" == yaml.content
+    assert isinstance(yaml.lasterr, OSError)
+    assert yaml is not YAMLFile.cached(str(tmp_path))
+
+    dts = DTSFile.cached(str(tmp_path))
+    assert isinstance(dts.lasterr, OSError)
+    assert dts is not DTSFile.cached(str(tmp_path))
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0,
+    reason="file permissions are not enforced",
+)
+def test_yamlfile_cached_chmod(tmp_path: Path) -> None:
+    tmp_yaml = tmp_path / "tmp.yaml"
+    tmp_yaml.write_text("on-bus: i2c\n")
+    tmp_yaml.chmod(0)
+    yaml = YAMLFile.cached(str(tmp_yaml))
+    assert "" == yaml.content
+    assert isinstance(yaml.lasterr, PermissionError)
+
+    # Readable again, content unchanged.
+    tmp_yaml.chmod(0o644)
+    yaml = YAMLFile.cached(str(tmp_yaml))
+    assert "i2c" == yaml.raw["on-bus"]
+    assert yaml is YAMLFile.cached(str(tmp_yaml))
@@ -434,6 +434,11 @@ def test_dtnode_get_child() -> None:
 
     with pytest.raises(KeyError):
         dtmodel.root.get_child("notachild")
+    # Only direct children.
+    with pytest.raises(KeyError):
+        dtmodel.root.get_child("soc/random@4000d000")
+    with pytest.raises(KeyError):
+        dtmodel["/soc"].get_child("/soc")
 
 
 def test_dtnode_vendor() -> None:
@@ -991,6 +996,8 @@ def test_dtnode_properties() -> None:
     assert "array" == dtprop_irqs.dttype
     assert isinstance(dtprop_irqs.value, list)
     assert [0x29, 0x1] == dtprop_irqs.value
+    # Values are converted once.
+    assert dtprop_irqs.value is dtprop_irqs.value
 
     assert dt_qspi.has_dtproperty("pinctrl-0")
     dtprop_pinctrl0 = dt_qspi.dtproperty("pinctrl-0")
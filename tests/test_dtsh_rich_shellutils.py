@@ -44,6 +44,9 @@ def test_dtsh_node_fmt_spc() -> None:
 def test_dtsh_node_fmt() -> None:
     # Parse all valid format specifiers.
     assert NODE_COL_ALL == DTShNodeFmt.parse(NODE_FMT_ALL)
+    # Parsed formats are memoized, but not shared.
+    DTShNodeFmt.parse(NODE_FMT_ALL).clear()
+    assert NODE_COL_ALL == DTShNodeFmt.parse(NODE_FMT_ALL)
 
     # Client code expect DTShError on invalid format string.
     with pytest.raises(DTShError):
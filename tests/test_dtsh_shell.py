@@ -248,6 +248,9 @@ def test_dtshcommand() -> None:
     )
     assert "hfa:" == cmd.getopt_short
     assert ["help", "flag", "argument="] == cmd.getopt_long
+    # Computed once.
+    assert cmd.synopsis is cmd.synopsis
+    assert cmd.getopt_long is cmd.getopt_long
 
     assert [DTShFlagHelp(), mock_flag, mock_arg] == cmd.options
     assert cmd.param is mock_param
@@ -257,6 +260,7 @@ def test_dtshcommand() -> None:
     assert cmd.option("not_an_option") is None
 
     assert mock_flag is cmd.with_option(MockFlag)
+    assert mock_flag is cmd.get_option(MockFlag)
     # The flag is not set.
     assert not cmd.with_flag(MockFlag)
 
@@ -269,6 +273,8 @@ def test_dtshcommand() -> None:
     with pytest.raises(KeyError):
         # Flag must exist.
         cmd.with_flag(MockFlagInval)
+    # Unless we ask if it's supported.
+    assert cmd.get_option(MockFlagInval) is None
 
     class MockArgInval(DTShArg):
         pass
@@ -434,6 +440,13 @@ def test_dtsh_realpath() -> None:
     with pytest.raises(DTPathNotFoundError):
         sh.realpath("&label_not_found")
 
+    # Resolved paths are remembered within bounds.
+    for i in range(DTSh._REALPATHS_MAX + 1):
+        assert f"/node{i}" == sh.realpath(f"node{i}")
+    assert DTSh._REALPATHS_MAX == len(sh._realpaths)
+    assert "node0" not in sh._realpaths
+    assert "/soc" == sh.realpath("soc")
+
 
 def test_dtsh() -> None:
     cmd_ls = DTShCommand("ls", "", [], None)